@@ -2,11 +2,13 @@
 Copyright (c) Cutleast
 """
 
+import functools
 import logging
 import platform
 import time
 from abc import ABCMeta, abstractmethod
 from argparse import Namespace
+from collections.abc import Callable
 from pathlib import Path
 from typing import Optional, override
 
@@ -20,8 +22,37 @@ from .core.utilities.exception_handler import ExceptionHandler
 from .core.utilities.exe_info import get_current_path, get_execution_info
 from .core.utilities.logger import Logger
 from .core.utilities.updater import Updater
+from .core.utilities.web_utils import update_user_agent
 from .ui.utilities.theme_manager import ThemeManager
 
+_LOG_SEPARATOR: str = "=" * 100
+"""Separator line framing the application name in the startup log."""
+
+
+@functools.cache
+def _get_platform_info() -> str:
+    """
+    Returns:
+        str: Description of the platform the application is running on. This does not
+            change during runtime and is therefore cached.
+    """
+
+    return f"{platform.system()} {platform.version()} {platform.architecture()[0]}"
+
+
+@functools.cache
+def _get_log_banner(app_name: str) -> str:
+    """
+    Args:
+        app_name (str): Name of the application.
+
+    Returns:
+        str: Banner with the application name that is logged at startup.
+    """
+
+    log_title: str = f" {app_name} ".center(len(_LOG_SEPARATOR), "=")
+    return f"\n{_LOG_SEPARATOR}\n{log_title}\n{_LOG_SEPARATOR}"
+
 
 class ABCQtMeta(type(QApplication), ABCMeta):  # pyright: ignore[reportGeneralTypeIssues]
     """
@@ -100,6 +131,11 @@ class BaseApp(QApplication, metaclass=ABCQtMeta):  # pyright: ignore[reportImpli
             f"{self.applicationName()} v{self.applicationVersion()}"
         )
 
+        # Web requests identify the application with its current name and version
+        update_user_agent()
+        self.applicationNameChanged.connect(update_user_agent)
+        self.applicationVersionChanged.connect(update_user_agent)
+
         self.app_config = self._load_app_config()
 
         log_file: Path = self.log_path / time.strftime(self.app_config.log_file_name)
@@ -161,20 +197,18 @@ class BaseApp(QApplication, metaclass=ABCQtMeta):  # pyright: ignore[reportImpli
         cmd: list[str]
         compiled: bool
         cmd, compiled = get_execution_info()
-        width = 100
-        log_title = f" {self.applicationName()} ".center(width, "=")
-        self.log.info(f"\n{'=' * width}\n{log_title}\n{'=' * width}")
-        self.log.info(f"Program Version: {self.applicationVersion()}")
-        self.log.debug(f"Executed command: {cmd}")
-        self.log.info(f"Frozen/compiled: {compiled}")
-        self.log.debug(f"Current Path: {self.cur_path}")
-        self.log.debug(f"Resource Path: {self.res_path}")
-        self.log.debug(f"Data Path: {self.data_path}")
-        self.log.debug(f"Log Path: {self.log_path}")
-        self.log.info(
-            "Detected Platform: "
-            f"{platform.system()} {platform.version()} {platform.architecture()[0]}"
-        )
+        info: Callable[[str], None] = self.log.info
+        debug: Callable[[str], None] = self.log.debug
+
+        info(_get_log_banner(self.applicationName()))
+        info(f"Program Version: {self.applicationVersion()}")
+        debug(f"Executed command: {cmd}")
+        info(f"Frozen/compiled: {compiled}")
+        debug(f"Current Path: {self.cur_path}")
+        debug(f"Resource Path: {self.res_path}")
+        debug(f"Data Path: {self.data_path}")
+        debug(f"Log Path: {self.log_path}")
+        info(f"Detected Platform: {_get_platform_info()}")
 
     def check_for_updates(self) -> None:
         """
@@ -182,9 +216,10 @@ class BaseApp(QApplication, metaclass=ABCQtMeta):  # pyright: ignore[reportImpli
         `get_repo_owner()` do not return None.
         """
 
-        repo_name: Optional[str] = self.get_repo_name()
-        repo_branch: Optional[str] = self.get_repo_branch()
-        repo_owner: Optional[str] = self.get_repo_owner()
+        repo_name: Optional[str]
+        repo_branch: Optional[str]
+        repo_owner: Optional[str]
+        repo_name, repo_branch, repo_owner = self._get_repo_info()
 
         if not repo_name or not repo_branch or not repo_owner:
             return
@@ -255,6 +290,20 @@ class BaseApp(QApplication, metaclass=ABCQtMeta):  # pyright: ignore[reportImpli
             self.app_config.log_num_of_files,
         )
 
+    @classmethod
+    @functools.cache
+    def _get_repo_info(cls) -> tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        Returns the repository information which is constant for an application and is
+        therefore cached.
+
+        Returns:
+            tuple[Optional[str], Optional[str], Optional[str]]:
+                GitHub repository name, branch and owner.
+        """
+
+        return cls.get_repo_name(), cls.get_repo_branch(), cls.get_repo_owner()
+
     @classmethod
     @abstractmethod
     def get_repo_owner(cls) -> Optional[str]:
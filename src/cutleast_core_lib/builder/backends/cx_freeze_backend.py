@@ -2,6 +2,7 @@
 Copyright (c) Cutleast
 """
 
+import copy
 import shutil
 import sys
 from pathlib import Path
@@ -18,6 +19,16 @@ class CxFreezeBackend(BuildBackend):
     **Requires `cx_Freeze` to be installed in the project's environment!**
     """
 
+    BASE_BUILD_OPTIONS: dict[str, Any] = {
+        "replace_paths": [("*", "")],
+        "include_files": [],
+        "packages": ["ctypes", "comtypes"],
+        "includes": ["ctypes.wintypes", "comtypes.stream"],
+        "excludes": ["tkinter", "unittest"],
+        "zip_include_packages": ["encodings", "PySide6", "shiboken6"],
+    }
+    """Base build options passed to cx_Freeze. Copied for each build before merging."""
+
     def get_additional_build_options(
         self,
         main_module: Path,
@@ -58,16 +69,9 @@ class CxFreezeBackend(BuildBackend):
         from cx_Freeze import Executable, setup  # pyright: ignore[reportMissingImports]
 
         outpath: Path = Path.cwd() / f"{main_module.stem}.dist"
-        build_options: dict[str, Any] = {
-            "replace_paths": [("*", "")],
-            "include_files": [],
-            "include_path": str(main_module.parent),
-            "packages": ["ctypes", "comtypes"],
-            "includes": ["ctypes.wintypes", "comtypes.stream"],
-            "excludes": ["tkinter", "unittest"],
-            "zip_include_packages": ["encodings", "PySide6", "shiboken6"],
-            "build_exe": str(outpath),
-        }
+        build_options: dict[str, Any] = copy.deepcopy(self.BASE_BUILD_OPTIONS)
+        build_options["include_path"] = str(main_module.parent)
+        build_options["build_exe"] = str(outpath)
 
         # Merge additional build options
         for option, additional_option in self.get_additional_build_options(
@@ -2,6 +2,7 @@
 Copyright (c) Cutleast
 """
 
+import logging
 import shutil
 import sys
 from enum import Enum
@@ -21,7 +22,7 @@ class NuitkaBackend(BuildBackend):
     **Requires `Nuitka` to be installed in the project's environment!**
     """
 
-    BASE_ARGS: list[str] = [
+    BASE_ARGS: tuple[str, ...] = (
         sys.executable,
         "-m",
         "nuitka",
@@ -31,8 +32,8 @@ class NuitkaBackend(BuildBackend):
         "--enable-plugin=pyside6",
         "--nofollow-import-to=tkinter",
         "--assume-yes-for-downloads",
-    ]
-    """A list of base arguments passed to Nuitka."""
+    )
+    """A tuple of base arguments passed to Nuitka."""
 
     class ConsoleMode(Enum):
         """Enum for Nuitka's supported console modes."""
@@ -100,7 +101,7 @@ class NuitkaBackend(BuildBackend):
         icon_path: Optional[Path],
         metadata: BuildMetadata,
     ) -> Path:
-        cmd = NuitkaBackend.BASE_ARGS
+        cmd: list[str] = [*NuitkaBackend.BASE_ARGS]
         cmd += self.get_additional_args(main_module, exe_stem, icon_path, metadata)
         cmd += [
             f"--windows-console-mode={self.console_mode.value}",
@@ -117,7 +118,8 @@ class NuitkaBackend(BuildBackend):
             cmd.append(f"--windows-icon-from-ico={icon_path}")
 
         cmd.append(str(main_module))
-        self.log.info(f"Running Nuitka command: '{' '.join(cmd)}'...")
+        if self.log.isEnabledFor(logging.INFO):
+            self.log.info(f"Running Nuitka command: '{' '.join(cmd)}'...")
         run_process(cmd, live_output=True)
 
         dist_folder = Path(main_module.stem + ".dist")
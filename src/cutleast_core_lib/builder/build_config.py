@@ -38,7 +38,10 @@ class BuildConfig(BaseModel, frozen=True):
     """
 
     delete_list: list[Path] = Field(default_factory=list)
-    """List of paths to remove from final bundle."""
+    """
+    List of paths or glob patterns (relative to the dist folder) to remove from final
+    bundle.
+    """
 
     build_dir: Optional[Path] = None
     """Temporary build directory (defaults to `[project root]/build`)."""
@@ -4,6 +4,8 @@ Copyright (c) Cutleast
 
 from __future__ import annotations
 
+import functools
+import os
 import tomllib
 from pathlib import Path
 from typing import Any, Optional
@@ -54,31 +56,94 @@ class BuildMetadata(BaseModel, frozen=True, arbitrary_types_allowed=True):
             BuildMetadata: The project's metadata.
         """
 
-        project_data: dict[str, Any] = tomllib.loads(
-            project_file.read_text(encoding="utf8")
-        )["project"]
-        project_name: str = project_data.get("description", project_data["name"])
-        project_version = Version(project_data["version"])
-
-        project_author: Optional[str] = None
-        if "authors" in project_data:
-            project_author = project_data["authors"][0]["name"]
+        project_file = project_file.resolve()
+        stat: os.stat_result = project_file.stat()
+        project_data: dict[str, Any] = _load_project_data(
+            project_file, stat.st_mtime_ns, stat.st_size
+        )
 
-        project_license: Optional[str] = None
+        # The license file is part of the cache key, so that changes to it are
+        # picked up even if the pyproject.toml file did not change
+        license_mtime_ns: Optional[int] = None
+        license_size: Optional[int] = None
         if "license" in project_data:
-            license_file: Path = project_file.parent / project_data["license"]["file"]
-            project_license = (
-                license_file.read_text(encoding="utf8").splitlines()[0].strip()
-            )
-
-        file_version = str(project_version.truncate())
-        if project_version.prerelease:
-            file_version += "." + project_version.prerelease[0].rsplit("-", 1)[1]
-
-        return BuildMetadata(
-            display_name=project_name,
-            project_version=project_version,
-            file_version=file_version,
-            project_author=project_author,
-            project_license=project_license,
+            license_stat: os.stat_result = (
+                project_file.parent / project_data["license"]["file"]
+            ).stat()
+            license_mtime_ns = license_stat.st_mtime_ns
+            license_size = license_stat.st_size
+
+        return _parse_pyproject(
+            project_file, stat.st_mtime_ns, stat.st_size, license_mtime_ns, license_size
         )
+
+
+@functools.lru_cache(maxsize=8)
+def _load_project_data(project_file: Path, mtime_ns: int, size: int) -> dict[str, Any]:
+    """
+    Loads the project table of the specified pyproject.toml file. The result is
+    cached by the file's path, modification time and size and must not be modified.
+
+    Args:
+        project_file (Path): The resolved path to the pyproject.toml file.
+        mtime_ns (int): The modification time of the file in nanoseconds.
+        size (int): The size of the file in bytes.
+
+    Returns:
+        dict[str, Any]: The project table.
+    """
+
+    with project_file.open("rb") as file:
+        return tomllib.load(file)["project"]
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_pyproject(
+    project_file: Path,
+    mtime_ns: int,
+    size: int,
+    license_mtime_ns: Optional[int],
+    license_size: Optional[int],
+) -> BuildMetadata:
+    """
+    Parses the specified pyproject.toml file. The result is cached by the path,
+    modification time and size of the file and its license file.
+
+    Args:
+        project_file (Path): The resolved path to the pyproject.toml file.
+        mtime_ns (int): The modification time of the file in nanoseconds.
+        size (int): The size of the file in bytes.
+        license_mtime_ns (Optional[int]):
+            The modification time of the license file in nanoseconds, if any.
+        license_size (Optional[int]): The size of the license file in bytes, if any.
+
+    Returns:
+        BuildMetadata: The project's metadata.
+    """
+
+    project_data: dict[str, Any] = _load_project_data(project_file, mtime_ns, size)
+
+    project_name: str = project_data.get("description", project_data["name"])
+    project_version = Version(project_data["version"])
+
+    project_author: Optional[str] = None
+    if "authors" in project_data:
+        project_author = project_data["authors"][0]["name"]
+
+    project_license: Optional[str] = None
+    if "license" in project_data:
+        license_file: Path = project_file.parent / project_data["license"]["file"]
+        with license_file.open(encoding="utf8") as file:
+            project_license = file.readline().strip()
+
+    file_version = str(project_version.truncate())
+    if project_version.prerelease:
+        file_version += "." + project_version.prerelease[0].rsplit("-", 1)[1]
+
+    return BuildMetadata(
+        display_name=project_name,
+        project_version=project_version,
+        file_version=file_version,
+        project_author=project_author,
+        project_license=project_license,
+    )
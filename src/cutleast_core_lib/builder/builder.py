@@ -2,13 +2,19 @@
 Copyright (c) Cutleast
 """
 
+import glob
 import logging
+import os
 import shutil
 import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import jstyleson as json
 
+from cutleast_core_lib.core.filesystem.utils import str_glob_many
+
 from .build_backend import BuildBackend
 from .build_config import BuildConfig
 from .build_metadata import BuildMetadata
@@ -34,6 +40,25 @@ class Builder:
         ),
     }
 
+    STORED_SUFFIXES: set[str] = {
+        ".7z",
+        ".bz2",
+        ".gif",
+        ".gz",
+        ".ico",
+        ".jpeg",
+        ".jpg",
+        ".png",
+        ".rar",
+        ".webp",
+        ".xz",
+        ".zip",
+    }
+    """
+    Suffixes of already compressed files that are stored uncompressed in the output
+    archive as compressing them again takes time without reducing their size.
+    """
+
     def __init__(self, config: BuildConfig, backend: BuildBackend) -> None:
         """
         Args:
@@ -88,15 +113,16 @@ class Builder:
         ext_res_file: Path = self.config.project_root / self.config.ext_resources_json
         res_folder: Path = ext_res_file.parent
         raw_resources: list[str] = json.loads(ext_res_file.read_text("utf8"))
-        external_resources: dict[Path, Path] = {
-            i.relative_to(self.config.project_root): (
-                res_folder.relative_to(self.config.project_root)
-                / i.relative_to(res_folder)
-            )
-            for item in raw_resources
-            for i in res_folder.glob(item)
-            if i.is_file()
-        }
+        rel_res_folder: Path = res_folder.relative_to(self.config.project_root)
+
+        # The glob results are always below the resource folder (lexically), so the
+        # source path relative to the project's root is also the destination path
+        external_resources: dict[Path, Path] = {}
+        for item in raw_resources:
+            for file in res_folder.glob(item):
+                if file.is_file():
+                    rel_path: Path = rel_res_folder / file.relative_to(res_folder)
+                    external_resources[rel_path] = rel_path
 
         self.log.info(
             f"Got {len(external_resources)} external resource files from "
@@ -118,34 +144,71 @@ class Builder:
             dist_folder (Path): Path to the dist folder.
         """
 
-        for file, dst in files.items():
-            src: Path = self.config.project_root / file
-            dst: Path = dist_folder / dst
+        copies: list[tuple[Path, Path]] = [
+            (self.config.project_root / src, dist_folder / dst)
+            for src, dst in files.items()
+        ]
+
+        for folder in {dst.parent for _, dst in copies}:
+            folder.mkdir(parents=True, exist_ok=True)
+
+        def copy(src: Path, dst: Path) -> None:
             self.log.info(f"Copying '{src}' to '{dst}'...")
-            dst.parent.mkdir(parents=True, exist_ok=True)
             shutil.copy(src, dst)
 
+        # The resources are usually many small files so the copies are run concurrently
+        with ThreadPoolExecutor() as executor:
+            for future in [executor.submit(copy, src, dst) for src, dst in copies]:
+                future.result()
+
         self.log.info(
             f"Copied {len(files)} external resource files to '{dist_folder}'."
         )
 
     def __delete_unused_files(self, dist_folder: Path) -> None:
         """
-        Deletes configured unused files from the dist folder.
+        Deletes configured unused files from the dist folder. Entries of the delete list
+        may also be glob patterns which are all matched in a single scan of the dist
+        folder.
 
         Args:
             dist_folder (Path): Path to the dist folder.
         """
 
-        for file in self.config.delete_list:
-            file: Path = dist_folder / file
-            if file.is_file():
-                file.unlink()
-                self.log.info(f"Deleted '{file}'.")
+        files: list[Path] = []
+        patterns: list[str] = []
+        for entry in self.config.delete_list:
+            if glob.has_magic(str(entry)):
+                patterns.append(str(entry))
+            else:
+                files.append(dist_folder / entry)
+
+        if patterns:
+            dist_files: list[str] = [
+                os.path.relpath(os.path.join(folder, file_name), dist_folder)
+                for folder, _, file_names in os.walk(dist_folder)
+                for file_name in file_names
+            ]
+            files.extend(
+                dist_folder / file for file in str_glob_many(patterns, dist_files)
+            )
 
-        self.log.info(
-            f"Deleted {len(self.config.delete_list)} unused files from '{dist_folder}'."
-        )
+        deleted: int = 0
+        for file in files:
+            try:
+                os.unlink(file)
+            except FileNotFoundError:
+                continue
+            except OSError:
+                # Folders are not deleted
+                if file.is_dir():
+                    continue
+                raise
+
+            deleted += 1
+            self.log.info(f"Deleted '{file}'.")
+
+        self.log.info(f"Deleted {deleted} unused files from '{dist_folder}'.")
 
     def __archive_dist(self, dist_folder: Path, output_path: Path) -> None:
         """
@@ -161,12 +224,26 @@ class Builder:
             output_path.unlink()
             self.log.warning(f"Deleted existing '{output_path}'.")
 
-        shutil.make_archive(
-            base_name=str(output_path.with_suffix("")),
-            format="zip",
-            root_dir=dist_folder.parent,
-            base_dir=dist_folder.name,
-        )
+        root_dir: Path = dist_folder.parent
+        with zipfile.ZipFile(
+            output_path, "w", compression=zipfile.ZIP_DEFLATED
+        ) as archive:
+            for folder, _, file_names in os.walk(dist_folder):
+                folder_path = Path(folder)
+                archive.write(folder_path, folder_path.relative_to(root_dir))
+
+                for file_name in file_names:
+                    file_path: Path = folder_path / file_name
+                    compression: int = zipfile.ZIP_DEFLATED
+                    if file_path.suffix.lower() in Builder.STORED_SUFFIXES:
+                        compression = zipfile.ZIP_STORED
+
+                    archive.write(
+                        file_path,
+                        file_path.relative_to(root_dir),
+                        compress_type=compression,
+                    )
+
         self.log.info(f"Created archive from '{dist_folder}' at '{output_path}'.")
 
     def run(self) -> Path:
@@ -178,10 +255,9 @@ class Builder:
         """
 
         start: float = time.time()
+        version: str = str(self.metadata.project_version)
 
-        self.log.info(
-            f"Building {self.metadata.display_name} v{self.metadata.project_version}..."
-        )
+        self.log.info(f"Building {self.metadata.display_name} v{version}...")
 
         build_folder: Path = self.config.project_root / "build"
         if self.config.build_dir is not None:
@@ -207,8 +283,11 @@ class Builder:
                 shutil.rmtree(dist_folder)
                 self.log.warning(f"Deleted existing '{dist_folder}'.")
 
-            self.log.info(f"Copying '{backend_output}' to '{dist_folder}'...")
-            shutil.copytree(backend_output, dist_folder)
+            # Moving is a simple rename when both folders are on the same volume and
+            # avoids copying the entire backend output
+            self.log.info(f"Moving '{backend_output}' to '{dist_folder}'...")
+            dist_folder.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(backend_output, dist_folder)
 
             external_resources: dict[Path, Path] = (
                 Builder.BASE_RES | self.__load_external_resources()
@@ -221,7 +300,7 @@ class Builder:
             output_archive: Path = (
                 self.config.project_root
                 / "dist"
-                / f"{self.metadata.display_name}_v{self.metadata.project_version}.zip"
+                / f"{self.metadata.display_name}_v{version}.zip"
             )
             if self.config.output_archive is not None:
                 output_archive = self.config.output_archive
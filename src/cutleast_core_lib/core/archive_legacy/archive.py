@@ -4,10 +4,13 @@ Copyright (c) Cutleast
 
 import logging
 import os
+import tempfile
 from abc import ABCMeta, abstractmethod
+from collections.abc import Iterable
 from pathlib import Path
+from typing import Optional
 
-from ..filesystem.utils import str_glob
+from ..filesystem.utils import str_glob, str_glob_many
 from ..utilities.exe_info import get_current_path
 from ..utilities.process_runner import run_process
 
@@ -25,6 +28,11 @@ class Archive(metaclass=ABCMeta):
 
     log: logging.Logger = logging.getLogger("Archive")
 
+    threads: Optional[int] = None
+    """
+    Number of threads 7-zip may use for extraction or None to let 7-zip decide.
+    """
+
     def __init__(self, path: Path) -> None:
         """
         Args:
@@ -53,6 +61,20 @@ class Archive(metaclass=ABCMeta):
 
         return self.files
 
+    def _get_switches(self) -> list[str]:
+        """
+        Returns:
+            list[str]:
+                Additional 7-zip switches that disable the output and progress
+                indicator (which nobody reads) and configure the number of threads.
+        """
+
+        return [
+            "-bso0",
+            "-bsp0",
+            "-mmt" if self.threads is None else f"-mmt{self.threads}",
+        ]
+
     def extract_all(self, dest: Path, full_paths: bool = True) -> None:
         """
         Extracts archive content.
@@ -73,6 +95,7 @@ class Archive(metaclass=ABCMeta):
             f"-o{dest}",
             "-aoa",
             "-y",
+            *self._get_switches(),
         ]
 
         run_process(cmd)
@@ -97,6 +120,7 @@ class Archive(metaclass=ABCMeta):
             f"-o{dest}",
             "-aoa",
             "-y",
+            *self._get_switches(),
             "--",
             str(self.path),
             filename,
@@ -129,13 +153,17 @@ class Archive(metaclass=ABCMeta):
             f"-o{dest}",
             "-aoa",
             "-y",
+            *self._get_switches(),
             str(self.path),
         ]
 
-        # Write filenames to a txt file to workaround commandline length limit
-        filenames_txt = self.path.with_suffix(".txt")
-        with open(filenames_txt, "w", encoding="utf8") as file:
+        # Write filenames to a temporary txt file to workaround commandline length
+        # limit
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf8", suffix=".txt", delete=False
+        ) as file:
             file.write("\n".join(filenames))
+            filenames_txt: str = file.name
         cmd.append(f"@{filenames_txt}")
 
         try:
@@ -143,6 +171,30 @@ class Archive(metaclass=ABCMeta):
         finally:
             os.remove(filenames_txt)
 
+    def extract_batched(
+        self, items: Iterable[tuple[str, Path]], full_paths: bool = True
+    ) -> None:
+        """
+        Extracts multiple files to possibly different folders with one extraction per
+        destination folder instead of one per file.
+
+        Args:
+            items (Iterable[tuple[str, Path]]):
+                Pairs of filenames to extract and folders to extract them to.
+            full_paths (bool, optional):
+                Toggles whether paths within archive are retained. Defaults to True.
+
+        Raises:
+            RuntimeError: When the 7-zip commandline returns a non-zero exit code.
+        """
+
+        groups: dict[Path, list[str]] = {}
+        for filename, dest in items:
+            groups.setdefault(dest, []).append(filename)
+
+        for dest, filenames in groups.items():
+            self.extract_files(filenames, dest, full_paths)
+
     def glob(self, pattern: str) -> list[str]:
         """
         Gets a list of file paths that match a specified pattern.
@@ -154,9 +206,24 @@ class Archive(metaclass=ABCMeta):
             list: List of matching filenames.
         """
 
-        matches: list[str] = str_glob(pattern, list(self.files))
+        matches: list[str] = str_glob(pattern, self.files)
         return matches
 
+    def glob_many(self, patterns: Iterable[str]) -> list[str]:
+        """
+        Gets a list of file paths that match at least one of the specified patterns.
+        This is faster than calling `Archive.glob()` for each pattern.
+
+        Args:
+            patterns (Iterable[str]):
+                Patterns that match everything that fnmatch supports
+
+        Returns:
+            list: List of matching filenames.
+        """
+
+        return str_glob_many(patterns, self.files)
+
     @staticmethod
     def load_archive(archive_path: Path) -> "Archive":
         """
@@ -20,10 +20,9 @@ class RARArchive(Archive):
     @override
     def files(self) -> list[str]:
         if self.__files is None:
-            self.__files = [
-                file.filename
-                for file in rarfile.RarFile(self.path).infolist()
-                if file.is_file()
-            ]
+            with rarfile.RarFile(self.path) as archive:
+                self.__files = [
+                    file.filename for file in archive.infolist() if file.is_file()
+                ]
 
         return self.__files
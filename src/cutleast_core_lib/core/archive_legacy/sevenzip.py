@@ -20,10 +20,9 @@ class SevenZipArchive(Archive):
     @override
     def files(self) -> list[str]:
         if self.__files is None:
-            self.__files = [
-                file.filename
-                for file in py7zr.SevenZipFile(self.path).files
-                if not file.is_directory
-            ]
+            with py7zr.SevenZipFile(self.path) as archive:
+                self.__files = [
+                    file.filename for file in archive.files if not file.is_directory
+                ]
 
         return self.__files
@@ -2,7 +2,11 @@
 Copyright (c) Cutleast
 """
 
+import functools
+import os
+import time
 import zipfile
+from pathlib import Path
 from typing import Optional, override
 
 from .archive import Archive
@@ -11,18 +15,151 @@ from .archive import Archive
 class ZIPARchive(Archive):
     """
     Class for ZIP Archives.
+
+    Files are extracted in-process with `zipfile` when full paths are retained. The
+    7-zip commandline is only used as fallback for archives or entries that `zipfile`
+    does not support.
     """
 
-    __files: Optional[list[str]] = None
+    __files: Optional[list[str]]
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path)
+
+        self.__files = None
 
     @property
     @override
     def files(self) -> list[str]:
         if self.__files is None:
-            self.__files = [
-                file.filename
-                for file in zipfile.ZipFile(self.path).filelist
-                if not file.is_dir()
-            ]
+            self.__files = list(
+                _list_zip(self.path.resolve(), self.path.stat().st_mtime_ns)
+            )
 
         return self.__files
+
+    @override
+    def extract_all(self, dest: Path, full_paths: bool = True) -> None:
+        if not full_paths or not self.__extract_natively(None, dest):
+            super().extract_all(dest, full_paths)
+
+    @override
+    def extract(self, filename: str, dest: Path, full_paths: bool = True) -> None:
+        if not full_paths or not self.__extract_natively([filename], dest):
+            super().extract(filename, dest, full_paths)
+
+    @override
+    def extract_files(
+        self, filenames: list[str], dest: Path, full_paths: bool = True
+    ) -> None:
+        if not filenames:
+            return
+
+        if not full_paths or not self.__extract_natively(filenames, dest):
+            super().extract_files(filenames, dest, full_paths)
+
+    def __extract_natively(self, filenames: Optional[list[str]], dest: Path) -> bool:
+        """
+        Attempts to extract the specified files with `zipfile`, retaining their paths
+        and modification times.
+
+        Args:
+            filenames (Optional[list[str]]):
+                Filenames to extract or None to extract all files.
+            dest (Path): Folder to extract the files to.
+
+        Raises:
+            RuntimeError: When the files could not be extracted or written.
+
+        Returns:
+            bool:
+                Whether the files were extracted. False if the archive, one of its
+                entries or one of the filenames is not supported by `zipfile`.
+        """
+
+        try:
+            archive = zipfile.ZipFile(self.path)
+        except zipfile.BadZipFile as ex:
+            self.__log_fallback(ex)
+            return False
+        except OSError as ex:
+            raise RuntimeError(f"Failed to open '{self.path}': {ex}") from ex
+
+        with archive:
+            try:
+                members: list[zipfile.ZipInfo] = archive.infolist()
+                if filenames is not None:
+                    # 7-zip also accepts backslashes and wildcards in filenames, which
+                    # are left to the fallback
+                    members = [
+                        archive.getinfo(filename.replace("\\", "/"))
+                        for filename in filenames
+                    ]
+
+                self.__extract_members(archive, members, dest)
+
+            # zipfile raises a RuntimeError for encrypted entries
+            except (KeyError, NotImplementedError, RuntimeError) as ex:
+                self.__log_fallback(ex)
+                return False
+
+            except (OSError, zipfile.BadZipFile) as ex:
+                raise RuntimeError(
+                    f"Failed to extract from '{self.path}': {ex}"
+                ) from ex
+
+        return True
+
+    def __log_fallback(self, ex: Exception) -> None:
+        self.log.debug(
+            f"Failed to extract from '{self.path}' with zipfile, falling back to "
+            f"7-zip: {ex}"
+        )
+
+    @staticmethod
+    def __extract_members(
+        archive: zipfile.ZipFile, members: list[zipfile.ZipInfo], dest: Path
+    ) -> None:
+        """
+        Extracts the specified members and restores their modification times like
+        7-zip does.
+
+        Args:
+            archive (zipfile.ZipFile): The opened archive.
+            members (list[zipfile.ZipInfo]): Members to extract.
+            dest (Path): Folder to extract the members to.
+        """
+
+        folder_times: list[tuple[str, float]] = []
+        for member in members:
+            target: str = archive.extract(member, dest)
+            mtime: float = time.mktime(member.date_time + (0, 0, -1))
+
+            # The times of folders are restored last since extracting files into
+            # them changes their modification times again
+            if member.is_dir():
+                folder_times.append((target, mtime))
+            else:
+                os.utime(target, (mtime, mtime))
+
+        for target, mtime in reversed(folder_times):
+            os.utime(target, (mtime, mtime))
+
+
+@functools.lru_cache(maxsize=64)
+def _list_zip(path: Path, mtime_ns: int) -> tuple[str, ...]:
+    """
+    Lists the files in a ZIP archive. The result is cached by the archive's path and
+    modification time so that loading the same archive again does not parse its
+    central directory again.
+
+    Args:
+        path (Path): The resolved path to the archive file.
+        mtime_ns (int): The modification time of the archive in nanoseconds.
+
+    Returns:
+        tuple[str, ...]: Filenames, relative to archive root.
+    """
+
+    with zipfile.ZipFile(path) as archive:
+        return tuple(file.filename for file in archive.infolist() if not file.is_dir())
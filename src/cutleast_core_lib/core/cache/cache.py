@@ -5,17 +5,24 @@ Copyright (c) Cutleast
 from __future__ import annotations
 
 import functools
+import json
 import logging
+import math
+import mmap
 import os
 import pickle
 import shutil
+import stat
+import threading
 import time
-from collections.abc import Callable
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
 from pathlib import Path
 from typing import Any, Optional, ParamSpec, TypeAlias, TypeVar
 
 from semantic_version import Version
 
+from cutleast_core_lib.core.filesystem.utils import is_folder_empty
 from cutleast_core_lib.core.utilities.singleton import Singleton
 
 from .function_cache import FunctionCache
@@ -28,6 +35,56 @@ C = TypeVar("C", bound="Cache")
 _Undefined = object()
 Undefined: TypeAlias = object
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # zstd support is optional in CPython builds
+    from compression import zstd
+except ImportError:
+    zstd = None
+
+_JSON_HEADER: bytes = b"J\x00"
+"""
+Header of cache files that contain JSON instead of pickle data. Pickle data always
+starts with the PROTO opcode (`b"\x80"`), so both can be told apart by the first bytes.
+"""
+
+_ZSTD_MAGIC: bytes = b"\x28\xb5\x2f\xfd"
+"""Magic number at the start of zstd-compressed cache files."""
+
+
+def _is_json_safe(data: Any) -> bool:
+    """
+    Checks if data can be stored as JSON and deserialized again without changing its
+    types, e.g. without turning tuples into lists.
+
+    Args:
+        data (Any): The data to check.
+
+    Returns:
+        bool: Whether the data only consists of JSON-compatible primitives.
+    """
+
+    data_type: type = type(data)
+    if data_type is str or data_type is int or data_type is bool or data is None:
+        return True
+
+    if data_type is float:
+        return math.isfinite(data)
+
+    if data_type is list:
+        return all(_is_json_safe(item) for item in data)
+
+    if data_type is dict:
+        return all(
+            type(key) is str and _is_json_safe(value) for key, value in data.items()
+        )
+
+    return False
+
 
 class Cache(Singleton):
     """
@@ -42,6 +99,17 @@ class Cache(Singleton):
 
     log: logging.Logger = logging.getLogger("Cache")
 
+    MEMO_SIZE: int = 128
+    """Maximum number of deserialized cache files that are kept in memory."""
+
+    __memo: OrderedDict[str, tuple[int, int, Any]] = OrderedDict()
+    """
+    Deserialized cache files in least recently used order, mapped by their path to
+    their modification time (in nanoseconds), their size and their content.
+    """
+
+    __memo_lock: threading.Lock = threading.Lock()
+
     def __init__(self, cache_path: Path, app_version: str) -> None:
         """
         Args:
@@ -67,7 +135,7 @@ class Cache(Singleton):
                 self.clear_caches()
                 self.log.info("Cleared caches due to outdated cache version.")
 
-        elif self.path.is_dir() and os.listdir(self.path):
+        elif self.path.is_dir() and not is_folder_empty(self.path):
             self.clear_caches()
             self.log.info("Cleared caches due to missing cache version file.")
 
@@ -80,13 +148,86 @@ class Cache(Singleton):
         """
 
         shutil.rmtree(self.path, ignore_errors=True)
+        with Cache.__memo_lock:
+            Cache.__memo.clear()
         self.log.info("Caches cleared.")
 
     @classmethod
-    @FunctionCache.cache
-    def __read_file(cls, file_path: Path) -> Any:
+    def __read_file(cls, file_path: Path, file_stat: os.stat_result) -> Any:
+        """
+        Reads and deserializes a cache file. The content is kept in memory until the
+        file is modified or evicted by more recently used files.
+
+        Args:
+            file_path (Path): The path to the cache file.
+            file_stat (os.stat_result): The current stat result of the cache file.
+
+        Returns:
+            Any: The deserialized content of the cache file.
+        """
+
+        key: str = str(file_path)
+        with cls.__memo_lock:
+            entry: Optional[tuple[int, int, Any]] = cls.__memo.get(key)
+            if (
+                entry is not None
+                and entry[0] == file_stat.st_mtime_ns
+                and entry[1] == file_stat.st_size
+            ):
+                cls.__memo.move_to_end(key)
+                return entry[2]
+
+        data: Any = cls.__load_file(file_path)
+
+        with cls.__memo_lock:
+            cls.__memo[key] = (file_stat.st_mtime_ns, file_stat.st_size, data)
+            cls.__memo.move_to_end(key)
+            while len(cls.__memo) > cls.MEMO_SIZE:
+                cls.__memo.popitem(last=False)
+
+        return data
+
+    @staticmethod
+    def __load_file(file_path: Path) -> Any:
         with file_path.open("rb") as file:
-            return pickle.load(file)
+            # Mapping the file lets pickle read it directly from the page cache instead
+            # of copying it into intermediate buffers first
+            try:
+                data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Empty files and files on some filesystems cannot be mapped
+                header: bytes = file.read(len(_ZSTD_MAGIC))
+                file.seek(0)
+                if header.startswith(_JSON_HEADER) or header == _ZSTD_MAGIC:
+                    return Cache.__load_data(file.read())
+
+                return pickle.load(file)
+
+            with data:
+                return Cache.__load_data(data)
+
+    @staticmethod
+    def __load_data(data: bytes | mmap.mmap) -> Any:
+        if data[: len(_JSON_HEADER)] == _JSON_HEADER:
+            return Cache.__load_json(data[len(_JSON_HEADER) :])
+
+        if data[: len(_ZSTD_MAGIC)] == _ZSTD_MAGIC:
+            if zstd is None:
+                raise RuntimeError(
+                    "Cache file is compressed but zstd is not available!"
+                )
+
+            return pickle.loads(zstd.decompress(data))
+
+        return pickle.loads(data)
+
+    @staticmethod
+    def __load_json(data: bytes) -> Any:
+        if orjson is not None:
+            return orjson.loads(data)
+
+        # Cache files written with orjson can still be read without it
+        return json.loads(data)
 
     @classmethod
     def get_from_cache(
@@ -97,7 +238,8 @@ class Cache(Singleton):
     ) -> Any | T:
         """
         Gets the content of a cache file and deserializes it with pickle.
-        The data is only read once and then cached in-memory.
+        The data is only read once and then cached in-memory until the file gets
+        modified.
 
         Args:
             cache_file_path (Path):
@@ -106,8 +248,9 @@ class Cache(Singleton):
                 The maximum age of the cache file in seconds. Defaults to None.
                 When specified, the cache file is deleted if it is older than this.
             default (T | Undefined, optional):
-                The default value to return if the cache file does not exist. Defaults
-                to undefined (raising a `FileNotFoundError`).
+                The default value to return if the cache file does not exist or if
+                there is no cache instance. Defaults to undefined (raising a
+                `FileNotFoundError`).
 
         Raises:
             FileNotFoundError:
@@ -120,21 +263,39 @@ class Cache(Singleton):
         cache: Optional[Cache] = cls.get_optional()
         if cache is not None:
             cache_file_path = cache.path / cache_file_path
+        elif default is not _Undefined:
+            # Nothing is saved without a cache instance, so there is no need to look
+            # for the file
+            return default
+
+        file_stat: Optional[os.stat_result]
+        try:
+            file_stat = cache_file_path.stat()
+        except OSError:
+            file_stat = None
+
+        if file_stat is not None and not stat.S_ISREG(file_stat.st_mode):
+            file_stat = None
 
         # Delete existing cache file that got too old
         if (
-            cache_file_path.is_file()
+            file_stat is not None
             and max_age is not None
-            and (time.time() - cache_file_path.stat().st_mtime) > max_age
+            and (time.time() - file_stat.st_mtime) > max_age
         ):
             cache_file_path.unlink()
+            file_stat = None
             cls.log.debug(f"Deleted old cache file: {cache_file_path}")
 
-        if not cache_file_path.is_file() and default is not _Undefined:
+        if file_stat is None and default is not _Undefined:
             return default
 
         try:
-            return cls.__read_file(cache_file_path)
+            if file_stat is None:
+                # Raises the appropriate error for the missing file
+                return cls.__load_file(cache_file_path)
+
+            return cls.__read_file(cache_file_path, file_stat)
         except Exception as ex:
             cls.log.error(
                 f"Failed to read cache file '{cache_file_path}': {ex}", exc_info=ex
@@ -162,8 +323,94 @@ class Cache(Singleton):
 
         cache_file_path = cache.path / cache_file_path
         cache_file_path.parent.mkdir(parents=True, exist_ok=True)
-        with cache_file_path.open("wb") as file:
-            pickle.dump(data, file)
+        with cls.__memo_lock:
+            cls.__memo.pop(str(cache_file_path), None)
+
+        # The data is written to a temporary file first and then moved in place, so that
+        # readers never see a partially written file after a crash or while another
+        # thread or process writes the same cache file
+        temp_file_path: Path = cache_file_path.with_name(
+            f"{cache_file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            # A 1 MiB buffer avoids a write syscall for every small pickle frame
+            with temp_file_path.open("wb", buffering=1 << 20) as file:
+                json_data: Optional[bytes] = cls.__dump_json(data)
+                if json_data is not None:
+                    file.write(_JSON_HEADER)
+                    file.write(json_data)
+                elif zstd is not None:
+                    # Level 1 is fast enough to be outweighed by the smaller files
+                    with zstd.ZstdFile(file, "wb", level=1) as compressed_file:
+                        pickle.dump(
+                            data, compressed_file, protocol=pickle.HIGHEST_PROTOCOL
+                        )
+                else:
+                    pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+            os.replace(temp_file_path, cache_file_path)
+        except BaseException:
+            temp_file_path.unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def __dump_json(data: Any) -> Optional[bytes]:
+        """
+        Serializes data with orjson if it only consists of JSON-compatible primitives,
+        which is considerably faster to read and write than pickle.
+
+        Args:
+            data (Any): The data to serialize.
+
+        Returns:
+            Optional[bytes]:
+                The serialized data or None if orjson is not available or the data
+                has to be pickled.
+        """
+
+        if orjson is None or not _is_json_safe(data):
+            return None
+
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            # For example integers exceeding 64 bit
+            return None
+
+    @classmethod
+    def invalidate(cls, cache_file_path: Path, *, prefix: bool = False) -> None:
+        """
+        Deletes a cache file and its in-memory data.
+        **Does nothing if there is no cache instance.**
+
+        Args:
+            cache_file_path (Path):
+                The path to the cache file, relative to the cache folder.
+            prefix (bool, optional):
+                Whether to also delete all cache files in the folder at the specified
+                path. Defaults to False.
+        """
+
+        cache: Optional[Cache] = cls.get_optional()
+        if cache is None:
+            return
+
+        cache_file_path = cache.path / cache_file_path
+        key: str = str(cache_file_path)
+        with cls.__memo_lock:
+            cls.__memo.pop(key, None)
+
+            if prefix:
+                folder_prefix: str = os.path.join(key, "")
+                for memo_key in [k for k in cls.__memo if k.startswith(folder_prefix)]:
+                    del cls.__memo[memo_key]
+
+        if prefix and cache_file_path.is_dir():
+            shutil.rmtree(cache_file_path, ignore_errors=True)
+        else:
+            cache_file_path.unlink(missing_ok=True)
+
+        cls.log.debug(f"Invalidated cache file: {cache_file_path}")
 
     @classmethod
     def persistent_cache(
@@ -172,6 +419,7 @@ class Cache(Singleton):
         cache_subfolder: Optional[Path] = None,
         id_generator: Optional[Callable[..., str]] = None,
         max_age: Optional[float] = None,
+        depends_on: Optional[Iterable[Path]] = None,
     ) -> Callable[[Callable[P, R]], Callable[P, R]]:
         """
         Caches the result of a function in a specified cache folder using pickle.
@@ -187,20 +435,26 @@ class Cache(Singleton):
                 Defaults to `Cache.get_func_identifier()`.
             max_age (Optional[float]):
                 The maximum age of the cache file in seconds. Defaults to None.
+            depends_on (Optional[Iterable[Path]]):
+                Cache files or folders, relative to the cache folder, that depend on the
+                result of the function. They are invalidated whenever a new result is
+                saved. Defaults to None.
 
         Returns:
             Callable[P, R]: The wrapped function with caching enabled.
         """
 
+        dependents: tuple[Path, ...] = tuple(depends_on or ())
+
+        cache_folder: Path = (
+            Path("function_cache") if cache_subfolder is None else cache_subfolder
+        )
+
         def decorator(func: Callable[P, R]) -> Callable[P, R]:
+            qualname: str = func.__qualname__
+
             @functools.wraps(func)
             def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-                cache_folder: Path
-                if cache_subfolder is None:
-                    cache_folder = Path("function_cache")
-                else:
-                    cache_folder = cache_subfolder
-
                 cache_file_name: str
                 if id_generator is None:
                     cache_file_name = FunctionCache.get_func_identifier(
@@ -217,13 +471,15 @@ class Cache(Singleton):
                 if result is None:
                     result = func(*args, **kwargs)
                     cls.save_to_cache(cache_file_path, result)
-                    cls.log.debug(
-                        f"Saved result for function '{func.__qualname__}' in cache."
-                    )
-                else:
-                    cls.log.debug(
-                        f"Got cached result for function '{func.__qualname__}'."
-                    )
+                    for dependent in dependents:
+                        cls.invalidate(dependent, prefix=True)
+
+                    if cls.log.isEnabledFor(logging.DEBUG):
+                        cls.log.debug(
+                            f"Saved result for function '{qualname}' in cache."
+                        )
+                elif cls.log.isEnabledFor(logging.DEBUG):
+                    cls.log.debug(f"Got cached result for function '{qualname}'.")
 
                 return result
 
@@ -2,12 +2,15 @@
 Copyright (c) Cutleast
 """
 
+import string
 from pathlib import Path
 
 from PySide6.QtWidgets import QApplication
 
 from cutleast_core_lib.core.config.exceptions import ConfigValidationError
 
+_HEX_DIGITS_TABLE: dict[int, int | None] = str.maketrans("", "", string.hexdigits)
+
 
 class ValidationUtils:
     """
@@ -31,15 +34,9 @@ class ValidationUtils:
 
         color_code = color_code.removeprefix("#")
 
-        if (len(color_code) == 6) or (len(color_code) == 8):
-            try:
-                int(color_code, 16)
-                return True
-
-            except ValueError:
-                return False
-        else:
-            return False
+        # Removing all hex digits must leave nothing behind, this also rejects
+        # characters that `int(..., 16)` would accept like signs or underscores
+        return len(color_code) in (6, 8) and not color_code.translate(_HEX_DIGITS_TABLE)
 
     @classmethod
     def validate_hex_color(cls, color_code: str) -> str:
@@ -4,7 +4,6 @@ Copyright (c) Cutleast
 
 import logging
 import os
-import platform
 from email.message import Message
 from pathlib import Path
 from typing import Optional
@@ -12,12 +11,12 @@ from urllib.parse import SplitResult, urlsplit, urlunsplit
 
 import requests as req
 from PySide6.QtCore import QObject, Signal
-from PySide6.QtWidgets import QApplication
 
 from cutleast_core_lib.core.filesystem.utils import add_suffix
 
 from .multithreading.progress import ProgressUpdate, UpdateCallback, update
 from .utilities.scale import scale_value
+from .utilities.web_utils import get_user_agent
 
 
 class Downloader(QObject):
@@ -55,16 +54,7 @@ class Downloader(QObject):
 
         self.__stop_signal.connect(self.__stop_download)
 
-        app_name: str = QApplication.applicationName()
-        app_version: str = QApplication.applicationVersion()
-
-        if user_agent is None:
-            self.__user_agent = (
-                f"{app_name}/{app_version} ({platform.system()} {platform.version()}; "
-                f"{platform.architecture()[0]})"
-            )
-        else:
-            self.__user_agent = user_agent
+        self.__user_agent = user_agent if user_agent is not None else get_user_agent()
 
         self.__chunk_size = chunk_size
         self.__timeout = timeout
@@ -9,7 +9,7 @@ from typing import Self, override
 from pydantic import BaseModel
 
 from ..utilities.scale import scale_value
-from .utils import get_file_identifier, open_in_explorer
+from .utils import get_creation_time, get_file_identifier, open_in_explorer
 
 
 class File(BaseModel, frozen=True):
@@ -50,17 +50,26 @@ class File(BaseModel, frozen=True):
         if not entry.is_file():
             raise ValueError(f"Entry '{entry.path}' is not a file.")
 
-        creation_time: float
-        try:
-            creation_time = entry.stat().st_birthtime
-        except AttributeError:
-            creation_time = entry.stat().st_mtime
+        return cls._from_stat(entry.path, entry.stat())
+
+    @classmethod
+    def _from_stat(cls, path: str, stat: os.stat_result) -> Self:
+        """
+        Creates a File instance from a path and its stat result.
+
+        Args:
+            path (str): The path to the file.
+            stat (os.stat_result): The stat result of the file.
+
+        Returns:
+            File: A File instance representing the file.
+        """
 
         return cls(
-            path=Path(entry.path),
-            size=entry.stat().st_size,
-            last_modified=entry.stat().st_mtime,
-            creation_time=creation_time,
+            path=Path(path),
+            size=stat.st_size,
+            last_modified=stat.st_mtime,
+            creation_time=get_creation_time(stat),
         )
 
     @override
@@ -0,0 +1,95 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import os
+from array import array
+from pathlib import Path
+
+from .file import File
+from .utils import get_creation_time
+
+
+class FileTable:
+    """
+    Columnar representation of scanned files with one column per `File` attribute.
+
+    Iterating over a single column (e.g. summing all sizes or filtering by modification
+    time) is much cheaper than iterating over a list of `File` instances as the sizes
+    and timestamps are stored in contiguous arrays. `File` instances are only created
+    on demand.
+
+    This class is not meant to be filled outside of the DirectoryScanner class.
+    """
+
+    paths: list[Path]
+    """The paths to the files."""
+
+    sizes: array[int]
+    """The sizes of the files in bytes."""
+
+    last_modified: array[float]
+    """The timestamps of the last modifications of the files."""
+
+    creation_times: array[float]
+    """The timestamps when the files were created."""
+
+    def __init__(self) -> None:
+        self.paths = []
+        self.sizes = array("q")
+        self.last_modified = array("d")
+        self.creation_times = array("d")
+
+    def _append(self, path: str, stat: os.stat_result) -> None:
+        """
+        Adds a file to the table.
+
+        Args:
+            path (str): The path to the file.
+            stat (os.stat_result): The stat result of the file.
+        """
+
+        self.paths.append(Path(path))
+        self.sizes.append(stat.st_size)
+        self.last_modified.append(stat.st_mtime)
+        self.creation_times.append(get_creation_time(stat))
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def to_file(self, index: int) -> File:
+        """
+        Creates a File instance for the file at the specified index.
+
+        Args:
+            index (int): The index of the file.
+
+        Returns:
+            File: A File instance representing the file.
+        """
+
+        return File(
+            path=self.paths[index],
+            size=self.sizes[index],
+            last_modified=self.last_modified[index],
+            creation_time=self.creation_times[index],
+        )
+
+    def to_files(self) -> list[File]:
+        """
+        Creates File instances for all files in the table.
+
+        Returns:
+            list[File]: List of File instances representing the files.
+        """
+
+        return [
+            File(path=path, size=size, last_modified=mtime, creation_time=ctime)
+            for path, size, mtime, ctime in zip(
+                self.paths,
+                self.sizes,
+                self.last_modified,
+                self.creation_times,
+                strict=True,
+            )
+        ]
@@ -4,12 +4,18 @@ Copyright (c) Cutleast
 
 import logging
 import os
+import re
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
+from typing import Optional
 
 from virtual_glob import InMemoryPath
 from virtual_glob import glob as vglob
 
 from .file import File
+from .file_table import FileTable
 
 
 class DirectoryScanner:
@@ -19,9 +25,21 @@ class DirectoryScanner:
 
     log: logging.Logger = logging.getLogger("DirectoryScanner")
 
+    SIMPLE_GLOB_PATTERN: re.Pattern[str] = re.compile(
+        r"((?:\*\*/)+)?(\*?)([^*?\[\]{}/\\]+)"
+    )
+    """
+    Glob patterns like `*.ext`, `name.ext`, `**/*.ext` or `**/name.ext` that only
+    depend on the file names and can be matched while scanning.
+    """
+
     @classmethod
     def scan_folder(
-        cls, folder: Path, recursive: bool = True, ignore_errors: bool = True
+        cls,
+        folder: Path,
+        recursive: bool = True,
+        ignore_errors: bool = True,
+        parallel: bool = False,
     ) -> list[File]:
         """
         Collects all files in a folder and returns them.
@@ -32,6 +50,10 @@ class DirectoryScanner:
                 Whether to collect files recursively from subfolders. Defaults to True.
             ignore_errors (bool):
                 Whether to ignore errors when accessing files/folders. Defaults to True.
+            parallel (bool):
+                Whether to scan the top-level subfolders concurrently in a thread pool.
+                This is faster for large folder trees, especially on network drives.
+                Defaults to False.
 
         Raises:
             Exception:
@@ -42,23 +64,185 @@ class DirectoryScanner:
             list[File]: List of File instances representing the files in the folder.
         """
 
-        result: list[File] = []
+        if not parallel or not recursive:
+            return cls.__scan_folders(
+                [folder],
+                ignore_errors,
+                root=folder,
+                subfolders=None if recursive else [],
+            )
 
-        for entry in os.scandir(folder):
-            entry_path = Path(entry.path)
+        subfolders: list[str | os.PathLike[str]] = []
+        result: list[File] = cls.__scan_folders(
+            [folder], ignore_errors, root=folder, subfolders=subfolders
+        )
 
-            try:
-                if entry.is_dir() and recursive:
-                    result.extend(cls.scan_folder(entry_path, recursive))
-                elif entry.is_file():
-                    result.append(File._from_dir_entry(entry))  # pyright: ignore[reportPrivateUsage]
+        if subfolders:
+            # Each worker collects the files of its subfolder in its own list, which are
+            # only concatenated at the end, in the order of the subfolders
+            with ThreadPoolExecutor() as executor:
+                result.extend(
+                    chain.from_iterable(
+                        executor.map(
+                            lambda subfolder: cls.__scan_folders(
+                                [subfolder], ignore_errors
+                            ),
+                            subfolders,
+                        )
+                    )
+                )
+
+        return result
+
+    @classmethod
+    def scan_folder_table(
+        cls, folder: Path, recursive: bool = True, ignore_errors: bool = True
+    ) -> FileTable:
+        """
+        Collects all files in a folder and returns them as a columnar table. This is
+        cheaper than `scan_folder()` when only some attributes of the files are needed.
+
+        Args:
+            folder (Path): The folder to collect files from.
+            recursive (bool):
+                Whether to collect files recursively from subfolders. Defaults to True.
+            ignore_errors (bool):
+                Whether to ignore errors when accessing files/folders. Defaults to True.
+
+        Raises:
+            Exception:
+                When an error occurs while scanning the folder and `ignore_errors` is
+                False.
+
+        Returns:
+            FileTable: Table of the files in the folder.
+        """
+
+        table = FileTable()
+        append: Callable[[str, os.stat_result], None] = table._append  # pyright: ignore[reportPrivateUsage]
+        for path, stat in cls.__iter_files(
+            [folder],
+            ignore_errors,
+            root=folder,
+            subfolders=None if recursive else [],
+        ):
+            append(path, stat)
+
+        return table
 
+    @classmethod
+    def __scan_folders(
+        cls,
+        folders: list[str | os.PathLike[str]],
+        ignore_errors: bool,
+        root: Optional[Path] = None,
+        subfolders: Optional[list[str | os.PathLike[str]]] = None,
+        name_filter: Optional[Callable[[str], bool]] = None,
+    ) -> list[File]:
+        """
+        Collects all files in the specified folders. See `__iter_files()` for details
+        on the parameters.
+
+        Returns:
+            list[File]: List of File instances representing the files in the folders.
+        """
+
+        from_stat: Callable[[str, os.stat_result], File] = File._from_stat  # pyright: ignore[reportPrivateUsage]
+
+        return [
+            from_stat(path, stat)
+            for path, stat in cls.__iter_files(
+                folders, ignore_errors, root, subfolders, name_filter
+            )
+        ]
+
+    @classmethod
+    def __iter_files(
+        cls,
+        folders: list[str | os.PathLike[str]],
+        ignore_errors: bool,
+        root: Optional[Path] = None,
+        subfolders: Optional[list[str | os.PathLike[str]]] = None,
+        name_filter: Optional[Callable[[str], bool]] = None,
+    ) -> Iterator[tuple[str, os.stat_result]]:
+        """
+        Yields the paths and stat results of all files in the specified folders.
+
+        The folders are scanned depth-first in the order they are listed by the
+        filesystem, and the files of a folder are yielded before the files of its
+        subfolders.
+
+        Args:
+            folders (list[str | os.PathLike[str]]):
+                Folders to scan. This list is consumed by this method.
+            ignore_errors (bool):
+                Whether to ignore errors when accessing files/folders.
+            root (Optional[Path], optional):
+                Folder for which access errors are never ignored. Defaults to None.
+            subfolders (Optional[list[str | os.PathLike[str]]], optional):
+                List to which found subfolders are added. Defaults to `folders` which
+                scans the subfolders recursively.
+            name_filter (Optional[Callable[[str], bool]], optional):
+                Function that returns whether a file with the specified name should be
+                included. Defaults to None.
+
+        Yields:
+            tuple[str, os.stat_result]: The path and stat result of a file.
+        """
+
+        if subfolders is None:
+            subfolders = folders
+
+        # Subfolders are scanned iteratively instead of recursively to avoid the
+        # overhead of a nested generator per folder
+        while folders:
+            current_folder: str | os.PathLike[str] = folders.pop()
+            try:
+                # The entries are read at once so that the directory handle is closed
+                # before the entries are processed and not kept open while the caller
+                # consumes the yielded files
+                with os.scandir(current_folder) as iterator:
+                    entries: list[os.DirEntry[str]] = list(iterator)
             except Exception as ex:
-                cls.log.error(f"Failed to scan '{entry_path}': {ex}", exc_info=ex)
+                # Errors while accessing the root folder itself are never ignored
+                if current_folder is root:
+                    raise
+
+                cls.log.error(f"Failed to scan '{current_folder}': {ex}", exc_info=ex)
                 if not ignore_errors:
                     raise
 
-        return result
+                continue
+
+            found_subfolders: list[str] = []
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        found_subfolders.append(entry.path)
+                        continue
+
+                    if (
+                        name_filter is not None and not name_filter(entry.name)
+                    ) or not entry.is_file():
+                        continue
+
+                    stat: os.stat_result = entry.stat()
+
+                except Exception as ex:
+                    cls.log.error(f"Failed to scan '{entry.path}': {ex}", exc_info=ex)
+                    if not ignore_errors:
+                        raise
+
+                    continue
+
+                yield entry.path, stat
+
+            if subfolders is folders:
+                # The subfolders are pushed in reverse, so that they are popped and
+                # scanned in the order they were found
+                folders.extend(reversed(found_subfolders))
+            else:
+                subfolders.extend(found_subfolders)
 
     @classmethod
     def glob_folder(
@@ -71,6 +255,12 @@ class DirectoryScanner:
         """
         Collects all files in a folder matching a glob pattern and returns them.
 
+        The pattern is matched against the paths relative to the folder, so `*.ext`
+        only matches files directly in the folder, `**/*.ext` matches files at any
+        depth and `sub/*.ext` matches files in the subfolder `sub`. Simple patterns
+        like `*.ext` or `**/name.ext` are matched against the file names while
+        scanning the folder.
+
         Args:
             folder (Path): The folder to collect files from.
             pattern (str): The glob pattern to match files.
@@ -92,22 +282,80 @@ class DirectoryScanner:
 
         case_sensitive: bool = os.name != "nt"  # Case insensitive on Windows
 
-        files: list[File] = cls.scan_folder(folder, recursive, ignore_errors)
+        match: Optional[re.Match[str]] = cls.SIMPLE_GLOB_PATTERN.fullmatch(pattern)
+        if match is not None:
+            # Simple patterns are matched while scanning, so that File instances are
+            # only created for matching files. Only patterns starting with `**/` match
+            # files in subfolders.
+            return cls.__scan_folders(
+                [folder],
+                ignore_errors,
+                root=folder,
+                subfolders=None if recursive and match.group(1) else [],
+                name_filter=cls.__get_name_filter(match, case_sensitive),
+            )
 
-        file_map: dict[str, File]
-        if case_sensitive:
-            file_map = {str(file.path): file for file in files}
-        else:
-            file_map = {str(file.path).lower(): file for file in files}
+        # The paths are collected in a single pass and File instances are only created
+        # for the matching files
+        file_map: dict[str, tuple[str, os.stat_result]] = {}
+        if not case_sensitive:
             pattern = pattern.lower()
 
-        fs: InMemoryPath = InMemoryPath.from_list(list(file_map.keys()))
+        # The pattern is matched against the paths relative to the folder
+        prefix_length: int = len(os.path.join(folder, ""))
+        for path, stat in cls.__iter_files(
+            [folder],
+            ignore_errors,
+            root=folder,
+            subfolders=None if recursive else [],
+        ):
+            relative_path: str = path[prefix_length:].replace(os.sep, "/")
+            if not case_sensitive:
+                relative_path = relative_path.lower()
+
+            file_map[relative_path] = (path, stat)
+
+        fs: InMemoryPath = InMemoryPath.from_list(file_map)
+        from_stat: Callable[[str, os.stat_result], File] = File._from_stat  # pyright: ignore[reportPrivateUsage]
         matches: list[File] = [
-            file_map[p.path] for p in vglob(fs, pattern) if p.path in file_map
+            from_stat(*file_map[p.path])
+            for p in vglob(fs, pattern)
+            if p.path in file_map
         ]
 
         return matches
 
+    @classmethod
+    def __get_name_filter(
+        cls, match: re.Match[str], case_sensitive: bool
+    ) -> Callable[[str], bool]:
+        """
+        Creates a filter function for file names from a simple glob pattern.
+
+        Args:
+            match (re.Match[str]):
+                Match of the glob pattern with `SIMPLE_GLOB_PATTERN`.
+            case_sensitive (bool): Whether the pattern is case sensitive.
+
+        Returns:
+            Callable[[str], bool]: Filter function for file names.
+        """
+
+        wildcard: bool = bool(match.group(2))
+        name: str = match.group(3)
+
+        if case_sensitive:
+            if wildcard:
+                return lambda file_name: file_name.endswith(name)
+
+            return lambda file_name: file_name == name
+
+        name = name.lower()
+        if wildcard:
+            return lambda file_name: file_name.lower().endswith(name)
+
+        return lambda file_name: file_name.lower() == name
+
     @classmethod
     def get_folder_size(cls, folder: Path, recursive: bool = True) -> int:
         """
@@ -119,7 +367,8 @@ class DirectoryScanner:
             if path.is_file():
                 total_size += path.stat().st_size
         ```
-        as it only makes a single call to the filesystem per file, rather than two.
+        as it only makes a single call to the filesystem per file, rather than two, and
+        does not create File instances.
 
         Args:
             folder (Path): The folder to calculate the size of.
@@ -130,4 +379,12 @@ class DirectoryScanner:
             int: The total size of all files in bytes.
         """
 
-        return sum(file.size for file in cls.scan_folder(folder, recursive))
+        return sum(
+            stat.st_size
+            for _, stat in cls.__iter_files(
+                [folder],
+                ignore_errors=True,
+                root=folder,
+                subfolders=None if recursive else [],
+            )
+        )
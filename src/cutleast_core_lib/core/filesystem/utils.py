@@ -4,14 +4,16 @@ Copyright (c) Cutleast
 
 import hashlib
 import os
-import re
 import shutil
 import subprocess
+from collections.abc import Iterable
 from pathlib import Path
 
 from virtual_glob import InMemoryPath
 from virtual_glob import glob as vglob
 
+_ILLEGAL_FS_CHARS_TABLE: dict[int, int | None] = str.maketrans("", "", ':<>?*"|')
+
 
 def create_folder_list(folder: Path) -> list[Path]:
     """
@@ -27,6 +29,22 @@ def create_folder_list(folder: Path) -> list[Path]:
     return [item.relative_to(folder) for item in folder.glob("**/*") if item.is_file()]
 
 
+def is_folder_empty(folder: os.PathLike) -> bool:
+    """
+    Checks if a folder is empty. Only the first entry of the folder is read, regardless
+    of how many entries the folder contains.
+
+    Args:
+        folder (os.PathLike): Folder to check.
+
+    Returns:
+        bool: Whether the folder has no files or subfolders.
+    """
+
+    with os.scandir(folder) as entries:
+        return next(entries, None) is None
+
+
 def get_file_identifier(file_path: os.PathLike) -> str:
     """
     Creates a blake2b hash of the file path and last modification timestamp and returns
@@ -39,10 +57,31 @@ def get_file_identifier(file_path: os.PathLike) -> str:
         str: First 8 characters of hash.
     """
 
-    mtime = os.path.getmtime(file_path)
-    data = f"{file_path}-{mtime}".encode()
-    digest = hashlib.blake2b(data, digest_size=8).hexdigest()
-    return digest[:8]
+    mtime: float = os.path.getmtime(file_path)
+
+    # The hashed data and digest size must stay the same to keep existing identifiers
+    # valid
+    hasher = hashlib.blake2b(digest_size=8)
+    hasher.update(os.fsencode(file_path))
+    hasher.update(b"-")
+    hasher.update(str(mtime).encode())
+    return hasher.hexdigest()[:8]
+
+
+def get_creation_time(stat: os.stat_result) -> float:
+    """
+    Gets the creation time from the stat result of a file. Falls back to the last
+    modification time if the creation time is not available on the platform or
+    filesystem.
+
+    Args:
+        stat (os.stat_result): The stat result of the file.
+
+    Returns:
+        float: The timestamp when the file was created.
+    """
+
+    return getattr(stat, "st_birthtime", stat.st_mtime)
 
 
 def clean_fs_name(folder_or_file_name: str) -> str:
@@ -56,7 +95,7 @@ def clean_fs_name(folder_or_file_name: str) -> str:
         str: Cleaned file or folder name.
     """
 
-    return re.sub(r'[:<>?*"|]', "", folder_or_file_name)
+    return folder_or_file_name.translate(_ILLEGAL_FS_CHARS_TABLE)
 
 
 def safe_copy(
@@ -127,6 +166,41 @@ def str_glob(pattern: str, files: list[str], case_sensitive: bool = False) -> li
     return matches
 
 
+def str_glob_many(
+    patterns: Iterable[str], files: list[str], case_sensitive: bool = False
+) -> list[str]:
+    """
+    Glob function for a list of files as strings that matches multiple patterns at
+    once. Unlike calling `str_glob()` for each pattern, the in-memory file tree is only
+    built once.
+
+    Args:
+        patterns (Iterable[str]): Glob patterns.
+        files (list[str]): List of files.
+        case_sensitive (bool, optional): Case sensitive. Defaults to False.
+
+    Returns:
+        list[str]: List of files matching at least one pattern, in their original order.
+    """
+
+    file_map: dict[str, str]
+    """
+    Map of original file names and normalized file names.
+    """
+
+    if case_sensitive:
+        file_map = {norm(file): file for file in files}
+        patterns = [norm(pattern) for pattern in patterns]
+    else:
+        file_map = {norm(file).lower(): file for file in files}
+        patterns = [norm(pattern).lower() for pattern in patterns]
+
+    fs: InMemoryPath = InMemoryPath.from_list(list(file_map.keys()))
+    matched: set[str] = {p.path for pattern in patterns for p in vglob(fs, pattern)}
+
+    return [file for key, file in file_map.items() if key in matched]
+
+
 def glob(pattern: str, files: list[Path], case_sensitive: bool = False) -> list[Path]:
     """
     Glob function for a list of files as paths.
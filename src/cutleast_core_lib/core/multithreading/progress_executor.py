@@ -4,7 +4,7 @@ Copyright (c) Cutleast
 
 from collections.abc import Callable
 from concurrent.futures import Future, ThreadPoolExecutor
-from threading import Event, Lock, current_thread
+from threading import Event, Lock, get_native_id, local
 from typing import Any, Concatenate, Optional, ParamSpec, TypeAlias, TypeVar, override
 
 from cutleast_core_lib.core.utilities.exceptions import TaskCancelledError
@@ -35,15 +35,23 @@ class ProgressExecutor(ThreadPoolExecutor):
 
     __display: Optional[ProgressDisplay] = None
     __lock: Lock
-    __completed_tasks: int
-    __pending_tasks: int
+    """Lock guarding the task counts and the worker ids."""
+
     __total_tasks: int
+    __started_tasks: int
+    __completed_tasks: int
     __cancelled_event: Event
+    __display_cancelled: bool = False
+    """Whether the progress display has been cancelled."""
 
-    __main_progress_text: str
+    __main_progress_template: str
+    """Format template for the main progress text and the number of completed tasks."""
 
-    __worker_ids: dict[str, int]
-    """Dictionary mapping the thread names to their progress id."""
+    __worker_ids: dict[int, int]
+    """Dictionary mapping the native thread ids to their progress id."""
+
+    __thread_local: local
+    """Thread-local storage caching the progress id of each worker thread."""
 
     def __init__(
         self,
@@ -68,17 +76,20 @@ class ProgressExecutor(ThreadPoolExecutor):
 
         self.__display = display
         self.__lock = Lock()
-        self.__completed_tasks = 0
-        self.__pending_tasks = 0
         self.__total_tasks = 0
+        self.__started_tasks = 0
+        self.__completed_tasks = 0
         self.__cancelled_event = Event()
         self.__worker_ids = {}
-        self.__main_progress_text = ""
+        self.__thread_local = local()
+        self.__main_progress_template = " ({} / {})"
 
         if display is not None:
-            display.cancelled.connect(
-                lambda: self.shutdown(wait=False, cancel_futures=True)
-            )
+            display.cancelled.connect(self.__on_display_cancelled)
+
+    def __on_display_cancelled(self) -> None:
+        self.__display_cancelled = True
+        self.shutdown(wait=False, cancel_futures=True)
 
     def set_main_progress_text(self, text: str) -> None:
         """
@@ -89,7 +100,9 @@ class ProgressExecutor(ThreadPoolExecutor):
             text (str): Base text to display.
         """
 
-        self.__main_progress_text = text
+        # Braces in the text must be escaped to not be mistaken for placeholders
+        escaped_text: str = text.replace("{", "{{").replace("}", "}}")
+        self.__main_progress_template = escaped_text + " ({} / {})"
 
     @override
     def submit(self, fn: WorkerFunction[P, T], *args: Any, **kwargs: Any) -> Future[T]:
@@ -113,48 +126,78 @@ class ProgressExecutor(ThreadPoolExecutor):
 
         with self.__lock:
             self.__total_tasks += 1
-            self.__pending_tasks += 1
 
         def worker_fn(*_args: P.args, **_kwargs: P.kwargs) -> T:
-            thread_name: str = current_thread().name
+            # The worker id is only looked up once per worker thread
+            worker_id: Optional[int] = getattr(self.__thread_local, "worker_id", None)
 
             with self.__lock:
-                worker_id: int = self.__worker_ids.setdefault(
-                    thread_name, len(self.__worker_ids) + 1
-                )
-                self.__pending_tasks -= 1
+                if worker_id is None:
+                    worker_id = self.__worker_ids.setdefault(
+                        get_native_id(), len(self.__worker_ids) + 1
+                    )
+                    self.__thread_local.worker_id = worker_id
+
+                self.__started_tasks += 1
+
+            task_worker_id: int = worker_id
 
             def update_callback(payload: ProgressUpdate) -> None:
                 if self.__cancelled_event.is_set():
                     raise TaskCancelledError
 
                 if self.__display is not None:
-                    self.__display.updateProgress(worker_id, payload)
+                    self.__display.updateProgress(task_worker_id, payload)
 
             try:
-                result: T = fn(update_callback, *_args, **_kwargs)
-                return result
-
+                return fn(update_callback, *_args, **_kwargs)
             finally:
-                with self.__lock:
-                    self.__completed_tasks += 1
+                self.__on_task_done(task_worker_id)
 
-                    if self.__pending_tasks < 1 and self.__display is not None:
-                        self.__display.removeProgress(worker_id)
+        return super().submit(worker_fn, *args, **kwargs)
 
-                if self.__display is not None:
-                    self.__display.updateMainProgress(
-                        ProgressUpdate(
-                            status_text=(
-                                f"{self.__main_progress_text} ({self.__completed_tasks} "
-                                f"/ {self.__total_tasks})"
-                            ),
-                            value=self.__completed_tasks,
-                            maximum=self.__total_tasks,
-                        )
+    def __on_task_done(self, worker_id: int) -> None:
+        """
+        Counts a completed task and updates the progress display.
+
+        Args:
+            worker_id (int): Progress id of the worker that ran the task.
+
+        Raises:
+            TaskCancelledError: If the progress display has been cancelled.
+        """
+
+        # The display is updated under the lock so that the main progress is never
+        # updated with an older count
+        with self.__lock:
+            self.__completed_tasks += 1
+
+            if self.__display is None:
+                return
+
+            # Remove the worker's progress bar if there are no pending tasks
+            if self.__started_tasks >= self.__total_tasks:
+                self.__display.removeProgress(worker_id)
+
+            # The main progress is only updated in steps of 0.5 % (and for the last
+            # task) as it would otherwise be updated for every single task
+            if (
+                self.__completed_tasks >= self.__total_tasks
+                or self.__completed_tasks % max(1, self.__total_tasks // 200) == 0
+            ):
+                self.__display.updateMainProgress(
+                    ProgressUpdate(
+                        status_text=self.__main_progress_template.format(
+                            self.__completed_tasks, self.__total_tasks
+                        ),
+                        value=self.__completed_tasks,
+                        maximum=self.__total_tasks,
                     )
+                )
 
-        return super().submit(worker_fn, *args, **kwargs)
+            # A skipped update must not hide the cancellation of the display
+            elif self.__display_cancelled:
+                raise TaskCancelledError
 
     @override
     def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
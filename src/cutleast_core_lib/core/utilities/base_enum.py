@@ -34,10 +34,9 @@ class BaseEnum(Enum):
             Self | T: Enum member or default value.
         """
 
-        try:
-            return cls[name]
-        except KeyError:
-            return default
+        # Look up the name directly in the member map maintained by EnumType instead of
+        # going through the comparatively slow `EnumType.__getitem__`
+        return cls._member_map_.get(name, default)  # pyright: ignore[reportReturnType]
 
     @overload
     @classmethod
@@ -63,8 +62,14 @@ class BaseEnum(Enum):
         """
 
         try:
-            return cls(value)
-        except KeyError:
+            return cls._value2member_map_.get(value, default)  # pyright: ignore[reportReturnType]
+        except TypeError:
+            # Unhashable values are not part of the value map and have to be compared
+            # with each member
+            for member in cls._member_map_.values():
+                if member._value_ == value:
+                    return member  # pyright: ignore[reportReturnType]
+
             return default
 
     @override
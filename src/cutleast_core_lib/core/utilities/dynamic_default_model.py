@@ -4,6 +4,7 @@ Copyright (c) Cutleast
 
 from __future__ import annotations
 
+import inspect
 from collections.abc import Callable, Iterator
 from typing import Any, ClassVar, ParamSpec, TypeVar, override
 
@@ -65,12 +66,18 @@ class DynamicDefaultModel(BaseModel):
         """
         Collects all callables in this class that are marked via decorator.
         Yields (field_name, callable) pairs.
+
+        This scans the class namespace and is only called once per class by
+        `__pydantic_init_subclass__`.
         """
 
         for obj in cls.__dict__.values():
+            # Most attributes are not marked, so the field name is checked first to
+            # only look up a single attribute for them
             field_name = getattr(obj, "__dynamic_default_field__", None)
-            is_marked = getattr(obj, "__is_dynamic_default_factory__", False)
-            if is_marked and isinstance(field_name, str):
+            if isinstance(field_name, str) and getattr(
+                obj, "__is_dynamic_default_factory__", False
+            ):
                 yield field_name, obj  # obj can be a function OR a classmethod
 
     @classmethod
@@ -82,16 +89,16 @@ class DynamicDefaultModel(BaseModel):
         as expected by pydantic.Field.default_factory.
         """
 
-        # If it is a classmethod object, bind it correctly to the class
+        # If it is a classmethod object, bind it once to the class; the bound method
+        # is already a zero-argument callable
         if isinstance(factory_obj, classmethod):
+            return factory_obj.__get__(None, cls)
 
-            def _zero_arg() -> Any:
-                bound = factory_obj.__get__(None, cls)
-                return bound()
-
-            return _zero_arg
+        # Regular callable without parameters can be used as is
+        if not inspect.signature(factory_obj).parameters:
+            return factory_obj
 
-        # Regular callable without parameters
+        # Pydantic would pass the validated data to a factory with parameters
         def _zero_arg() -> Any:
             return factory_obj()
 
@@ -105,11 +112,23 @@ class DynamicDefaultModel(BaseModel):
         - Inherit the mapping of dynamic default factories along the MRO
         - Override with the factories marked in *this* class
         - Apply the resulting factories to the Pydantic fields
-        - Rebuild the model to keep schema & validation consistent
+        - Rebuild the model to keep schema & validation consistent if fields were patched
         """
 
         super().__pydantic_init_subclass__(**kwargs)
 
+        own_factories: tuple[tuple[str, Callable[..., Any]], ...] = tuple(
+            cls.__iter_marked_factories__()
+        )
+
+        # Nothing to do for models without any dynamic default factories
+        if not own_factories and not any(
+            getattr(base, "__dynamic_default_factories__", None)
+            for base in cls.__bases__
+        ):
+            cls.__dynamic_default_factories__ = {}
+            return
+
         # 1) Inherit: build from base classes (from higher up to closer down)
         mapping: dict[str, Callable[..., Any]] = {}
         for base in reversed(cls.__mro__[1:]):  # from higher up in MRO to nearer classes
@@ -118,7 +137,7 @@ class DynamicDefaultModel(BaseModel):
                 mapping.update(base_map)
 
         # 2) Collect own marked factories in this class (override)
-        for field_name, factory_obj in cls.__iter_marked_factories__():
+        for field_name, factory_obj in own_factories:
             mapping[field_name] = factory_obj
 
         # 3) Attach mapping to this class (so further subclasses inherit/override it)
@@ -126,6 +145,7 @@ class DynamicDefaultModel(BaseModel):
 
         # 4) Apply to Pydantic fields (only if the field exists)
         model_fields = getattr(cls, "model_fields", {})
+        patched: bool = False
         for field_name, factory_obj in mapping.items():
             if field_name not in model_fields:
                 continue
@@ -136,7 +156,11 @@ class DynamicDefaultModel(BaseModel):
             # so that the field is considered "unset" when the user doesn't provide a value.
             field.default_factory = cls.__bind_factory_to_class__(factory_obj)
             field.default = PydanticUndefined
+            patched = True
 
         # 5) Rebuild the model to keep everything consistent (schema, validation, caches)
         # force=True because we modified fields at a low level.
-        cls.model_rebuild(force=True)
+        # The core schema captures the default factories when it is built, so this is
+        # required whenever a field was patched, but only then.
+        if patched:
+            cls.model_rebuild(force=True)
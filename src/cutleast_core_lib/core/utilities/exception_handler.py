@@ -115,12 +115,11 @@ class ExceptionHandler(QObject):
             bool: `True` if the callable raises the expected exception, `False` otherwise.
         """
 
+        # Other exceptions are not caught and propagate with their original traceback
+        caught_exception: type[BaseException] = expected_exception or Exception
         try:
             callable()
-        except Exception as ex:
-            if expected_exception is not None and not isinstance(ex, expected_exception):
-                raise
-
+        except caught_exception:
             return True
 
         return False
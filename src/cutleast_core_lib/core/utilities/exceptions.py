@@ -2,12 +2,11 @@
 Copyright (c) Cutleast
 """
 
+import sys
 import traceback
 from abc import abstractmethod
 from collections.abc import Callable
-from typing import Any, ParamSpec, TypeVar, override
-
-from PySide6.QtWidgets import QApplication
+from typing import Any, ClassVar, Optional, ParamSpec, TypeVar, override
 
 # Nuitka doesn't support the new syntax, yet, see https://github.com/Nuitka/Nuitka/issues/3423
 T = TypeVar("T")
@@ -38,7 +37,22 @@ def format_exception(
 class LocalizedException(Exception):
     """
     Base exception class for localized exceptions.
+
+    Implementations should import Qt lazily in `getLocalizedMessage()` so that this
+    module can be imported without loading PySide6.
+
+    Classes whose localized message is the same for all of their instances can opt in
+    to caching it by setting `CACHE_LOCALIZED_MESSAGE` to True.
+    """
+
+    CACHE_LOCALIZED_MESSAGE: ClassVar[bool] = False
     """
+    Whether the localized message of this exact class is cached once a Qt application
+    exists. This is not inherited by subclasses since they may override
+    `getLocalizedMessage()` with an instance-dependent message.
+    """
+
+    __message_cache: ClassVar[dict[type, str]] = {}
 
     def __init__(self, *values: Any) -> None:
         """
@@ -46,11 +60,31 @@ class LocalizedException(Exception):
             *values (Any): Values to format the message with.
         """
 
-        if self.getLocalizedMessage():
-            super().__init__(self.getLocalizedMessage().format(*values))
+        message: str = self.__get_message()
+
+        if message:
+            super().__init__(message.format(*values))
         else:
             super().__init__(*values)
 
+    def __get_message(self) -> str:
+        cls: type[LocalizedException] = type(self)
+        if not cls.__dict__.get("CACHE_LOCALIZED_MESSAGE", False):
+            return self.getLocalizedMessage()
+
+        message: Optional[str] = LocalizedException.__message_cache.get(cls)
+
+        if message is None:
+            message = self.getLocalizedMessage()
+
+            # Translations are only available when there is an application instance
+            # so the message must not be cached before one exists
+            qt_core = sys.modules.get("PySide6.QtCore")
+            if qt_core is not None and qt_core.QCoreApplication.instance() is not None:
+                LocalizedException.__message_cache[cls] = message
+
+        return message
+
     @abstractmethod
     def getLocalizedMessage(self) -> str:
         """
@@ -87,6 +121,8 @@ class RequestError(LocalizedException):
     Exception when a web request failed.
     """
 
+    CACHE_LOCALIZED_MESSAGE = True
+
     def __init__(self, request_url: str, *values: Any) -> None:
         """
         Args:
@@ -98,6 +134,8 @@ class RequestError(LocalizedException):
 
     @override
     def getLocalizedMessage(self) -> str:
+        from PySide6.QtWidgets import QApplication
+
         return QApplication.translate("exceptions", "Request to '{0}' failed!")
 
 
@@ -106,6 +144,8 @@ class Non200HttpError(RequestError):
     Exception when a request returned a non-200 HTTP status code.
     """
 
+    CACHE_LOCALIZED_MESSAGE = True
+
     def __init__(self, request_url: str, status_code: int) -> None:
         """
         Args:
@@ -117,6 +157,8 @@ class Non200HttpError(RequestError):
 
     @override
     def getLocalizedMessage(self) -> str:
+        from PySide6.QtWidgets import QApplication
+
         return QApplication.translate(
             "exceptions", "Request to '{0}' failed with status code {1}!"
         )
@@ -130,6 +172,8 @@ class ProcessIncompleteError(LocalizedException):
 
     @override
     def getLocalizedMessage(self) -> str:
+        from PySide6.QtWidgets import QApplication
+
         return QApplication.translate(
             "exceptions", "The process is incomplete and has no result!"
         )
@@ -142,4 +186,6 @@ class TaskCancelledError(LocalizedException, RuntimeError):
 
     @override
     def getLocalizedMessage(self) -> str:
+        from PySide6.QtWidgets import QApplication
+
         return QApplication.translate("exceptions", "The task was cancelled!")
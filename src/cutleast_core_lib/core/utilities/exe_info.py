@@ -2,13 +2,16 @@
 Copyright (c) Cutleast
 """
 
+import functools
 import sys
 from pathlib import Path
 
 
+@functools.cache
 def get_execution_info() -> tuple[list[str], bool]:
     """
     Returns information about the current execution environment.
+    The result is cached as it does not change during the lifetime of the process.
 
     Returns:
         tuple[list[str], bool]: Execution command and
@@ -27,6 +27,22 @@ def sha256_hash(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()[:8]
 
 
+def blake2b_hash(data: bytes, digest_size: int = 16) -> str:
+    """
+    Calculates a BLAKE2b hash of the given data. It is faster than SHA256 and its
+    hex digest is safe to use in filenames.
+
+    Args:
+        data (bytes): Data to hash.
+        digest_size (int, optional): Size of the digest in bytes. Defaults to 16.
+
+    Returns:
+        str: Hash as hex digest.
+    """
+
+    return hashlib.blake2b(data, digest_size=digest_size).hexdigest()
+
+
 def md5_hash_stream(
     stream: BinaryIO,
     size: int,
@@ -3,6 +3,7 @@ Copyright (c) Cutleast
 """
 
 import logging
+from functools import cache
 from typing import Optional
 
 from PySide6.QtCore import QLocale
@@ -10,9 +11,11 @@ from PySide6.QtCore import QLocale
 log: logging.Logger = logging.getLogger("Localisation")
 
 
+@cache
 def detect_system_locale() -> Optional[str]:
     """
     Attempts to detect the system locale.
+    The result is cached as the system locale does not change during runtime.
 
     Returns:
         str: System locale
@@ -23,9 +26,10 @@ def detect_system_locale() -> Optional[str]:
     system_locale: Optional[str] = None
 
     try:
+        qlocale: QLocale = QLocale.system()
         system_locale = (
-            f"{QLocale.languageToCode(QLocale.system().language())}_"
-            f"{QLocale.territoryToCode(QLocale.system().territory())}"
+            f"{QLocale.languageToCode(qlocale.language())}_"
+            f"{QLocale.territoryToCode(qlocale.territory())}"
         )
         log.debug(f"Detected system language: {system_locale}")
 
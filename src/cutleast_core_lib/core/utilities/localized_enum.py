@@ -3,7 +3,7 @@ Copyright (c) Cutleast
 """
 
 from abc import abstractmethod
-from typing import Self, TypeVar, override
+from typing import Any, ClassVar, Optional, Self, TypeVar, override
 
 from .base_enum import BaseEnum
 
@@ -15,6 +15,11 @@ class LocalizedEnum(BaseEnum):
     Enum with additional get_localized_name() and get_localized_description() methods.
     """
 
+    __members_by_localized_name: ClassVar[dict[type, dict[str, Any]]] = {}
+    """
+    Cache mapping each enum class to a mapping of localized names to their members.
+    """
+
     @override
     def __repr__(self) -> str:
         return self.name
@@ -31,6 +36,9 @@ class LocalizedEnum(BaseEnum):
         """
         Returns an enum member with the given localized name.
 
+        The localized names are cached on the first call, so
+        `invalidate_localization_cache()` has to be called after changing the language.
+
         Args:
             localized_name (str): Localized name.
 
@@ -41,11 +49,28 @@ class LocalizedEnum(BaseEnum):
             Self: Enum member
         """
 
-        for e in cls:
-            if e.get_localized_name() == localized_name:
-                return e
+        members: Optional[dict[str, Any]] = cls.__members_by_localized_name.get(cls)
+        if members is None:
+            members = {}
+            for member in cls:
+                # the first member with a localized name takes precedence
+                members.setdefault(member.get_localized_name(), member)
+
+            cls.__members_by_localized_name[cls] = members
+
+        if localized_name not in members:
+            raise ValueError(f"No enum member with localized name '{localized_name}'!")
+
+        return members[localized_name]
+
+    @classmethod
+    def invalidate_localization_cache(cls) -> None:
+        """
+        Clears the cached localized names of all localized enums. This is required after
+        changing the language.
+        """
 
-        raise ValueError(f"No enum member with localized name '{localized_name}'!")
+        LocalizedEnum.__members_by_localized_name.clear()
 
     def get_localized_description(self) -> str:
         """
@@ -64,12 +89,13 @@ class LocalizedEnum(BaseEnum):
             str: Localized summary
         """
 
-        summary: str = ""
+        lines: list[str] = []
         for member in cls:
-            if member.get_localized_description() == member.get_localized_name():
-                summary += f"{member.get_localized_name()}"
+            name: str = member.get_localized_name()
+            description: str = member.get_localized_description()
+            if description == name:
+                lines.append(name)
             else:
-                summary += f"{member.get_localized_name()}: {member.get_localized_description()}"
-            summary += "\n"
+                lines.append(f"{name}: {description}")
 
-        return summary.strip("\n ")
+        return "\n".join(lines)
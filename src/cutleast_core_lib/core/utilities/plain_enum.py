@@ -0,0 +1,192 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from collections.abc import Iterator
+from types import MappingProxyType
+from typing import Any, Never, Optional, Self, TypeVar, overload, override
+
+T = TypeVar("T")
+
+
+class PlainEnumMeta(type):
+    """
+    Lightweight metaclass for `PlainEnum` that turns all public, non-callable class
+    attributes into singleton member instances.
+    """
+
+    __member_map__: dict[str, Any]
+    __value_map__: dict[Any, Any]
+    __value_list__: Optional[list[Any]]
+    """
+    Members indexed by their value if all values are contiguous integers starting at 0.
+    """
+
+    __members__: MappingProxyType[str, Any]
+    """Read-only mapping of member names to members, like `Enum.__members__`."""
+
+    def __new__(
+        mcs, name: str, bases: tuple[type, ...], namespace: dict[str, Any]
+    ) -> "PlainEnumMeta":
+        members: dict[str, Any] = {
+            attr: value
+            for attr, value in namespace.items()
+            if not attr.startswith("_")
+            and not callable(value)
+            and not isinstance(value, (classmethod, staticmethod, property))
+        }
+
+        # Members must not get a __dict__ so that they stay as small as possible
+        namespace.setdefault("__slots__", ())
+        cls = super().__new__(mcs, name, bases, namespace)
+
+        member_map: dict[str, Any] = {}
+        value_map: dict[Any, Any] = {}
+        for attr, value in members.items():
+            member = object.__new__(cls)
+            object.__setattr__(member, "name", attr)
+            object.__setattr__(member, "value", value)
+            type.__setattr__(cls, attr, member)
+
+            member_map[attr] = member
+            value_map.setdefault(value, member)
+
+        cls.__member_map__ = member_map
+        cls.__value_map__ = value_map
+        cls.__value_list__ = None
+        cls.__members__ = MappingProxyType(member_map)
+
+        # Integer values 0..n-1 can be looked up by index instead of by hash
+        int_values: bool = all(type(value) is int for value in value_map)
+        if int_values and sorted(value_map) == list(range(len(value_map))):
+            cls.__value_list__ = [value_map[i] for i in range(len(value_map))]
+
+        return cls
+
+    def __iter__(cls) -> Iterator[Any]:
+        return iter(cls.__member_map__.values())
+
+    def __len__(cls) -> int:
+        return len(cls.__member_map__)
+
+    def __contains__(cls, member: object) -> bool:
+        return type(member) is cls
+
+    @override
+    def __setattr__(cls, name: str, value: Any) -> None:
+        if name in cls.__dict__.get("__member_map__", {}):
+            raise AttributeError(f"Cannot reassign member {name!r}.")
+
+        super().__setattr__(name, value)
+
+
+class PlainEnum(metaclass=PlainEnumMeta):
+    """
+    Enum-like base class whose members are plain instances stored as class attributes.
+
+    Accessing a member, comparing members with `is` and reading `.value` are simple
+    attribute loads, which makes this considerably faster than `BaseEnum` in hot code
+    paths. In exchange, it only supports a subset of the `Enum` features: members are
+    iterable and can be looked up with `get()` and `get_by_value()` like in `BaseEnum`,
+    but there are no aliases, no `auto()` and no functional API.
+
+    **Static type checkers see the members as their raw values, so `BaseEnum` should
+    still be preferred where this is not a bottleneck.**
+
+    Example:
+    ```
+    class Color(PlainEnum):
+        Red = "red"
+        Green = "green"
+
+    assert Color.get_by_value("red") is Color.Red
+    ```
+    """
+
+    __slots__ = ("name", "value")
+
+    name: str
+    """The name of the member."""
+
+    value: Any
+    """The value of the member."""
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Never:
+        raise TypeError(f"{cls.__name__} members cannot be instantiated.")
+
+    @overload
+    @classmethod
+    def get(cls, name: str, /) -> Optional[Self]: ...
+
+    @overload
+    @classmethod
+    def get(cls, name: str, default: T, /) -> Self | T: ...
+
+    @classmethod
+    def get(cls, name: str, default: Optional[T] = None, /) -> Optional[Self | T]:
+        """
+        Gets a member by name.
+
+        Args:
+            name (str): Name of the member.
+            default (T): Default value to return if no member has the given name.
+
+        Returns:
+            Self | T: Member or default value.
+        """
+
+        return cls.__member_map__.get(name, default)
+
+    @overload
+    @classmethod
+    def get_by_value(cls, value: Any, /) -> Optional[Self]: ...
+
+    @overload
+    @classmethod
+    def get_by_value(cls, value: Any, default: T, /) -> Self | T: ...
+
+    @classmethod
+    def get_by_value(
+        cls, value: Any, default: Optional[T] = None, /
+    ) -> Optional[Self | T]:
+        """
+        Gets a member by its value.
+
+        Args:
+            value (Any): Value of the member.
+            default (T): Default value to return if no member has the given value.
+
+        Returns:
+            Self | T: Member or default value.
+        """
+
+        value_list: Optional[list[Any]] = cls.__value_list__
+        if (
+            value_list is not None
+            and type(value) is int
+            and 0 <= value < len(value_list)
+        ):
+            return value_list[value]
+
+        try:
+            return cls.__value_map__.get(value, default)
+        except TypeError:
+            # Unhashable values are not part of the value map and have to be compared
+            # with each member
+            for member in cls.__member_map__.values():
+                if member.value == value:
+                    return member
+
+            return default
+
+    @override
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"Cannot modify member {self.name!r}.")
+
+    @override
+    def __reduce__(self) -> tuple[Any, tuple[type[Self], str]]:
+        return getattr, (type(self), self.name)
+
+    @override
+    def __repr__(self) -> str:
+        return self.name
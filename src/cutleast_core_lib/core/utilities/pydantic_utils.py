@@ -19,6 +19,13 @@ def include_literal_defaults(cls: type[ModelType]) -> type[ModelType]:
     even when `exclude_defaults=True` is used.
     """
 
+    # the Literal fields are determined once instead of on every serialization
+    literal_fields: tuple[str, ...] = tuple(
+        name
+        for name, field_info in cls.model_fields.items()
+        if get_origin(field_info.annotation) is Literal
+    )
+
     # this dynamic wrapper class is required in order to set the model serializer before
     # Pydantic builds the model
     class WrappedModel(cls):
@@ -28,10 +35,9 @@ def include_literal_defaults(cls: type[ModelType]) -> type[ModelType]:
         ) -> dict[str, Any]:
             dumped: dict[str, Any] = next_serializer(self)
 
-            for name, field_info in cls.model_fields.items():
-                if get_origin(field_info.annotation) is Literal:
-                    if name not in dumped:
-                        dumped[name] = getattr(self, name)
+            for name in literal_fields:
+                if name not in dumped:
+                    dumped[name] = getattr(self, name)
 
             return dumped
 
@@ -2,7 +2,7 @@
 Copyright (c) Cutleast
 """
 
-from collections.abc import Iterator, MutableMapping
+from collections.abc import Iterator, Mapping, MutableMapping, ValuesView
 from typing import Generic, Optional, TypeVar, overload, override
 
 K = TypeVar("K")
@@ -19,52 +19,70 @@ class ReferenceDict(MutableMapping[K, V], Generic[K, V]):
     dict keys, because it does not require the key type to be hashable. Two distinct
     objects that compare equal are treated as different keys.
 
+    Keys are referenced strongly for as long as they are stored in the container, so
+    their `id()` cannot be reused by another object in the meantime. This is also why
+    `weakref.WeakKeyDictionary` is not a replacement: it compares keys by hash
+    equality and requires them to be hashable.
+
     This class provides all features of the `Mapping` protocol.
     """
 
-    __values: dict[int, tuple[K, V]]
+    __keys: dict[int, K]
+    __values: dict[int, V]
 
     def __init__(
         self,
-        initial: Optional[dict[K, V]] = None,
+        initial: Optional[Mapping[K, V]] = None,
     ) -> None:
         """
         Initialises the container.
 
         Args:
-            initial (Optional[dict[K, V]]):
+            initial (Optional[Mapping[K, V]]):
                 Optional mapping whose key-value pairs are copied into this container.
                 Each key is registered by its current `id()`.  Defaults to an empty
                 mapping when `None`.
         """
 
-        if initial is None:
-            initial = {}
+        self.__keys = {}
+        self.__values = {}
 
-        self.__values = {id(k): (k, v) for k, v in initial.items()}
+        if initial:
+            for k, v in initial.items():
+                key_id: int = id(k)
+                self.__keys[key_id] = k
+                self.__values[key_id] = v
 
     @override
     def __getitem__(self, key: K) -> V:
         try:
-            return self.__values[id(key)][1]
+            return self.__values[id(key)]
         except KeyError:
             raise KeyError(key) from None
 
     @override
     def __setitem__(self, key: K, value: V) -> None:
-        self.__values[id(key)] = (key, value)
+        key_id: int = id(key)
+        self.__keys[key_id] = key
+        self.__values[key_id] = value
 
     @override
     def __delitem__(self, key: K) -> None:
+        key_id: int = id(key)
         try:
-            del self.__values[id(key)]
+            del self.__values[key_id]
         except KeyError:
             raise KeyError(key) from None
 
+        del self.__keys[key_id]
+
     @override
     def __iter__(self) -> Iterator[K]:
-        for key, _ in self.__values.values():
-            yield key
+        return iter(self.__keys.values())
+
+    @override
+    def values(self) -> ValuesView[V]:
+        return self.__values.values()
 
     @override
     def __len__(self) -> int:
@@ -89,18 +107,26 @@ class ReferenceDict(MutableMapping[K, V], Generic[K, V]):
         key: K,
         default: object = _MISSING,
     ) -> object:
+        key_id: int = id(key)
         try:
-            return self.__values.pop(id(key))[1]
+            value: V = self.__values.pop(key_id)
         except KeyError:
             if default is _MISSING:
                 raise KeyError(key) from None
             return default
 
+        del self.__keys[key_id]
+        return value
+
     @override
     def clear(self) -> None:
+        self.__keys.clear()
         self.__values.clear()
 
     @override
     def __repr__(self) -> str:
-        pairs = ", ".join(f"'{k}': '{v}'" for k, v in self.__values.values())
+        pairs = ", ".join(
+            f"'{k}': '{v}'"
+            for k, v in zip(self.__keys.values(), self.__values.values())
+        )
         return f"{type(self).__name__}({{{pairs}}})"
@@ -20,4 +20,4 @@ def reverse_dict(d: Mapping[K, V], /) -> dict[V, K]:
         dict[V, K]: The reversed dictionary.
     """
 
-    return {v: k for k, v in d.items()}
+    return dict(zip(d.values(), d.keys(), strict=True))
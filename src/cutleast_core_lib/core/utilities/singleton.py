@@ -74,10 +74,11 @@ class Singleton(metaclass=ABCMeta):
             Self: The current instance.
         """
 
-        if cls.__instance is None:
+        instance: Optional[Self] = cls.__instance
+        if instance is None:
             raise RuntimeError(f"{cls.__name__} is not initialized!")
 
-        return cls.__instance
+        return instance
 
 
 class SingletonQtMeta(type(QObject), type(Singleton)):  # pyright: ignore[reportGeneralTypeIssues]
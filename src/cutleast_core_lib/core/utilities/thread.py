@@ -2,16 +2,20 @@
 Copyright (c) Cutleast
 """
 
+import threading
 from collections.abc import Callable
 from typing import Generic, Optional, TypeVar, override
 
-from PySide6.QtCore import QThread
+from PySide6.QtCore import QObject, QThread, Signal
 from PySide6.QtWidgets import QWidget
 
 from .exceptions import ProcessIncompleteError
 
 T = TypeVar("T")
 
+_Unset = object()
+"""Placeholder for the result of a thread that has not finished yet."""
+
 
 def process_result(result: T | Exception) -> T:
     """
@@ -39,7 +43,7 @@ class Thread(QThread, Generic[T]):
     """
 
     __target: Callable[[], T]
-    __return_result: T | Exception
+    __return_result: T | Exception | object
 
     def __init__(
         self,
@@ -58,6 +62,7 @@ class Thread(QThread, Generic[T]):
         super().__init__(parent)
 
         self.__target = target
+        self.__return_result = _Unset
 
         if name is not None:
             self.setObjectName(name)
@@ -86,7 +91,73 @@ class Thread(QThread, Generic[T]):
             T | Exception: Return value of the target function or an exception
         """
 
+        result: T | Exception | object = self.__return_result
+        if result is _Unset:
+            raise ProcessIncompleteError
+
+        return result  # type: ignore
+
+
+class DaemonThread(QObject, Generic[T]):
+    """
+    Runs a target function in a Python daemon thread. Unlike a `Thread`, it may still
+    be running when the application quits, which makes it suitable for tasks that
+    cannot be interrupted, like web requests.
+
+    The `finished` signal is emitted after the target function returned and is
+    delivered in the thread of this object.
+    """
+
+    finished = Signal()
+    """Signal emitted when the target function returned or raised an exception."""
+
+    __target: Callable[[], T]
+    __name: Optional[str]
+    __return_result: T | Exception | object
+
+    def __init__(self, target: Callable[[], T], name: Optional[str] = None) -> None:
+        """
+        Args:
+            target (Callable[[], T]): The target function to run in the thread.
+            name (Optional[str], optional): The name of the thread. Defaults to None.
+        """
+
+        super().__init__()
+
+        self.__target = target
+        self.__name = name
+        self.__return_result = _Unset
+
+    def start(self) -> None:
+        """
+        Starts running the target function in a new daemon thread.
+        """
+
+        threading.Thread(target=self.__run, name=self.__name, daemon=True).start()
+
+    def __run(self) -> None:
         try:
-            return self.__return_result
-        except AttributeError:
-            raise ProcessIncompleteError from AttributeError
+            self.__return_result = self.__target()
+        except Exception as ex:  # noqa: BLE001
+            self.__return_result = ex
+
+        self.finished.emit()
+
+    def get_result(self) -> T | Exception:
+        """
+        Returns the return value of the target function or an exception.
+
+        Raises:
+            ProcessIncompleteError:
+                If the result of the thread was requested before the thread was
+                finished.
+
+        Returns:
+            T | Exception: Return value of the target function or an exception
+        """
+
+        result: T | Exception | object = self.__return_result
+        if result is _Unset:
+            raise ProcessIncompleteError
+
+        return result  # type: ignore
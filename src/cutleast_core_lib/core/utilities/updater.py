@@ -2,17 +2,22 @@
 Copyright (c) Cutleast
 """
 
+import json
 import logging
+from pathlib import Path
 from typing import Optional
 
-import jstyleson as json
+import jstyleson
 import requests
 import semantic_version as semver
 
 from cutleast_core_lib.ui.widgets.updater_dialog import UpdaterDialog
 
+from ..cache.cache import Cache
 from .exceptions import format_exception
+from .hash import blake2b_hash
 from .singleton import Singleton
+from .thread import DaemonThread, process_result
 from .web_utils import get_raw_web_content_uncached
 
 
@@ -29,10 +34,22 @@ class Updater(Singleton):
     changelog_url: str
     update_url: str
 
+    CHECK_INTERVAL: float = 6 * 60 * 60
+    """Time in seconds for which the result of an update check is reused by `run()`."""
+
     installed_version: semver.Version
     latest_version: Optional[semver.Version] = None
     download_url: str
 
+    __last_check_cache_file: Path
+    """Cache file storing the result of the last update check."""
+
+    __update_thread: Optional[DaemonThread[None]] = None
+    """Thread requesting the update info, referenced until it finished."""
+
+    __changelog_thread: Optional[DaemonThread[str]] = None
+    """Thread requesting the changelog, referenced until it finished."""
+
     def __init__(
         self, repo_name: str, repo_branch: str, repo_owner: str, installed_version: str
     ) -> None:
@@ -58,28 +75,130 @@ class Updater(Singleton):
             f"{self.repo_name}/{self.repo_branch}/update.json"
         )
         self.installed_version = semver.Version(installed_version)
+        self.__last_check_cache_file = Path("updater") / (
+            blake2b_hash(self.update_url.encode("utf8")) + ".cache"
+        )
 
     def run(self) -> None:
         """
-        Checks for updates and runs dialog.
+        Checks for updates in a background thread and shows the updater dialog from the
+        main thread if an update is available. The update info is only requested again
+        if the last check was more than `CHECK_INTERVAL` seconds ago and the changelog
+        is only requested if an update is available.
+
+        This method returns immediately, so errors of the update check are logged
+        instead of raised.
         """
 
+        if self.__update_thread is not None or self.__changelog_thread is not None:
+            return
+
         self.log.info("Checking for update...")
 
-        if self.is_update_available():
-            self.log.info(
-                f"Update available: Installed: {self.installed_version} - Latest: "
-                f"{self.latest_version}"
-            )
-
-            UpdaterDialog(
-                self.installed_version,
-                self.latest_version,  # type: ignore
-                self.get_changelog(),
-                self.download_url,
-            )
-        else:
+        if self.__load_last_update_check():
+            self.__on_update_checked()
+            return
+
+        # The request runs in a daemon thread, so that it does not keep the application
+        # from quitting, and its finished signal is delivered in the main thread
+        update_thread: DaemonThread[None] = DaemonThread(
+            self.__request_update, "UpdateThread"
+        )
+        update_thread.finished.connect(self.__on_update_requested)
+        self.__update_thread = update_thread
+        update_thread.start()
+
+    def __on_update_requested(self) -> None:
+        update_thread: Optional[DaemonThread[None]] = self.__update_thread
+        if update_thread is None:
+            return
+
+        self.__update_thread = None
+
+        try:
+            process_result(update_thread.get_result())
+        except Exception as ex:
+            self.log.warning(f"Failed to check for updates: {ex}", exc_info=ex)
+            return
+
+        self.__save_last_update_check()
+        self.__on_update_checked()
+
+    def __on_update_checked(self) -> None:
+        if not self.__is_latest_version_newer():
             self.log.info("No update available.")
+            return
+
+        self.log.info(
+            f"Update available: Installed: {self.installed_version} - Latest: "
+            f"{self.latest_version}"
+        )
+
+        changelog_thread: DaemonThread[str] = DaemonThread(
+            self.get_changelog, "ChangelogThread"
+        )
+        changelog_thread.finished.connect(self.__on_changelog_requested)
+        self.__changelog_thread = changelog_thread
+        changelog_thread.start()
+
+    def __on_changelog_requested(self) -> None:
+        changelog_thread: Optional[DaemonThread[str]] = self.__changelog_thread
+        if changelog_thread is None:
+            return
+
+        self.__changelog_thread = None
+
+        try:
+            changelog: str = process_result(changelog_thread.get_result())
+        except Exception as ex:
+            self.log.warning(f"Failed to request changelog: {ex}", exc_info=ex)
+            return
+
+        UpdaterDialog(
+            self.installed_version,
+            self.latest_version,  # type: ignore
+            changelog,
+            self.download_url,
+        )
+
+    def __load_last_update_check(self) -> bool:
+        """
+        Loads the latest version and download url from the last update check, if it
+        was less than `CHECK_INTERVAL` seconds ago.
+
+        Returns:
+            bool: `True` if the result of the last check was loaded, `False` otherwise.
+        """
+
+        data: Optional[dict[str, str]] = Cache.get_from_cache(
+            self.__last_check_cache_file,
+            max_age=Updater.CHECK_INTERVAL,
+            default=None,
+        )
+        if not isinstance(data, dict):
+            return False
+
+        try:
+            self.latest_version = semver.Version(data["version"])
+            self.download_url = data["download_url"]
+        except (KeyError, ValueError):
+            return False
+
+        self.log.debug("Using the result of the last update check.")
+        return True
+
+    def __save_last_update_check(self) -> None:
+        """
+        Saves the latest version and download url of a successful update check.
+        """
+
+        if self.latest_version is None:
+            return
+
+        Cache.save_to_cache(
+            self.__last_check_cache_file,
+            {"version": str(self.latest_version), "download_url": self.download_url},
+        )
 
     def is_update_available(self) -> bool:
         """
@@ -91,6 +210,16 @@ class Updater(Singleton):
 
         self.__request_update()
 
+        return self.__is_latest_version_newer()
+
+    def __is_latest_version_newer(self) -> bool:
+        """
+        Returns:
+            bool:
+                `True` if the latest requested version is newer than the installed
+                version, `False` otherwise.
+        """
+
         if self.latest_version is None:
             return False
 
@@ -105,8 +234,15 @@ class Updater(Singleton):
         try:
             response = get_raw_web_content_uncached(self.update_url)
 
-            latest_version_json: str = response.decode(encoding="utf8", errors="ignore")
-            latest_version_data: dict[str, str] = json.loads(latest_version_json)
+            latest_version_data: dict[str, str]
+            try:
+                # update.json is usually plain JSON that the C parser can read directly
+                latest_version_data = json.loads(response)
+            except ValueError:
+                latest_version_json: str = response.decode(
+                    encoding="utf8", errors="ignore"
+                )
+                latest_version_data = jstyleson.loads(latest_version_json)
             latest_version: str = latest_version_data["version"]
             self.latest_version = semver.Version(latest_version)
             self.download_url = latest_version_data["download_url"]
@@ -2,37 +2,151 @@
 Copyright (c) Cutleast
 """
 
+import platform
+import threading
+import time
+from concurrent.futures import Future
+from functools import cache
 from pathlib import Path
+from typing import Optional
 
-from requests import HTTPError, Response, get
+from pydantic import BaseModel
+from PySide6.QtCore import QCoreApplication
+from requests import HTTPError, Response, Session
+from requests.adapters import HTTPAdapter
 
 from cutleast_core_lib.core.utilities.exceptions import Non200HttpError
-from cutleast_core_lib.core.utilities.hash import sha256_hash
+from cutleast_core_lib.core.utilities.hash import blake2b_hash
 
 from ..cache.cache import Cache
 
+WEB_CACHE_FOLDER: Path = Path("web_cache")
+"""Cache subfolder for the fetched web contents."""
+
+WEB_CACHE_MAX_AGE: float = 60 * 60 * 24
+"""Time in seconds after which cached web contents are revalidated."""
+
+_in_flight_requests: dict[str, Future[bytes]] = {}
+"""Pending `get_raw_web_content()` calls mapped by their URL."""
+
+_in_flight_lock = threading.Lock()
+
+REQUEST_TIMEOUT: tuple[float, float] = (5, 15)
+"""Connect and read timeouts in seconds for the requests sent by this module."""
+
+_session = Session()
+"""
+Shared session, reusing connections to the same host across requests. Its user agent
+is set by `update_user_agent()` since the application name is not known at import
+time.
+"""
+_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+del _session.headers["User-Agent"]
+
+
+class CachedWebContent(BaseModel, frozen=True):
+    """
+    Cached content of a URL and the validators required for revalidating it.
+    """
+
+    content: bytes
+    """Raw content of the URL."""
+
+    etag: Optional[str] = None
+    """Value of the `ETag` header of the response, if any."""
+
+    last_modified: Optional[str] = None
+    """Value of the `Last-Modified` header of the response, if any."""
+
+    timestamp: float
+    """Time when the content was fetched or last revalidated."""
+
 
-@Cache.persistent_cache(
-    cache_subfolder=Path("web_cache"),
-    id_generator=lambda url: sha256_hash(url.encode("utf8")),
-    max_age=60 * 60 * 24,
-)
 def get_raw_web_content(url: str) -> bytes:
     """
     Fetches raw content from the given URL. The result is cached persistently for 24
-    hours.
+    hours. After that, the content is only downloaded again if it changed.
+    Concurrent calls for the same URL only send a single request.
 
     Args:
         url (str): URL to fetch content from.
 
     Raises:
-        Non200HttpError: If the status code is not 200.
+        Non200HttpError: If the status code is neither 200 nor 304.
+
+    Returns:
+        bytes: Raw content of the URL.
+    """
+
+    # Concurrent calls for the same URL share the result (or error) of the first call
+    with _in_flight_lock:
+        future: Optional[Future[bytes]] = _in_flight_requests.get(url)
+        is_owner: bool = future is None
+        if future is None:
+            future = Future()
+            _in_flight_requests[url] = future
+
+    if not is_owner:
+        return future.result()
+
+    try:
+        future.set_result(_get_raw_web_content(url))
+    except BaseException as ex:  # noqa: BLE001
+        future.set_exception(ex)
+    finally:
+        with _in_flight_lock:
+            del _in_flight_requests[url]
+
+    return future.result()
+
+
+def _get_raw_web_content(url: str) -> bytes:
+    """
+    Fetches raw content from the given URL or the web cache.
+
+    Args:
+        url (str): URL to fetch content from.
+
+    Raises:
+        Non200HttpError: If the status code is neither 200 nor 304.
 
     Returns:
         bytes: Raw content of the URL.
     """
 
-    return get_raw_web_content_uncached(url)
+    cache_file_path: Path = WEB_CACHE_FOLDER / (
+        blake2b_hash(url.encode("utf8")) + ".cache"
+    )
+    cached: Optional[CachedWebContent] = Cache.get_from_cache(
+        cache_file_path, default=None
+    )
+    if not isinstance(cached, CachedWebContent):
+        cached = None
+    elif time.time() - cached.timestamp <= WEB_CACHE_MAX_AGE:
+        return cached.content
+
+    headers: dict[str, str] = {}
+    if cached is not None and cached.etag is not None:
+        headers["If-None-Match"] = cached.etag
+    if cached is not None and cached.last_modified is not None:
+        headers["If-Modified-Since"] = cached.last_modified
+
+    res: Response = _request(url, headers)
+
+    if cached is not None and res.status_code == 304:
+        # The content did not change, so only the timestamp has to be refreshed
+        cached = cached.model_copy(update={"timestamp": time.time()})
+    else:
+        cached = CachedWebContent(
+            content=res.content,
+            etag=res.headers.get("ETag"),
+            last_modified=res.headers.get("Last-Modified"),
+            timestamp=time.time(),
+        )
+
+    Cache.save_to_cache(cache_file_path, cached)
+
+    return cached.content
 
 
 def get_raw_web_content_uncached(url: str) -> bytes:
@@ -49,11 +163,69 @@ def get_raw_web_content_uncached(url: str) -> bytes:
         bytes: Raw content of the URL.
     """
 
-    res: Response = get(url)
+    return _request(url).content
+
+
+def _request(url: str, headers: Optional[dict[str, str]] = None) -> Response:
+    """
+    Sends a GET request to the given URL.
+
+    Args:
+        url (str): URL to request.
+        headers (Optional[dict[str, str]], optional):
+            Additional request headers. Defaults to None.
+
+    Raises:
+        Non200HttpError: If the status code indicates an error.
+
+    Returns:
+        Response: The response.
+    """
+
+    if "User-Agent" not in _session.headers:
+        update_user_agent()
+
+    res: Response = _session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
 
     try:
         res.raise_for_status()
     except HTTPError as ex:
         raise Non200HttpError(url, res.status_code) from ex
 
-    return res.content
+    return res
+
+
+def update_user_agent() -> None:
+    """
+    Sets the user agent of the shared session from the current application name and
+    version. This is called by `BaseApp` when it is initialized and whenever the
+    application name or version changes, and on the first request otherwise.
+    """
+
+    _session.headers["User-Agent"] = get_user_agent()
+
+
+def get_user_agent() -> str:
+    """
+    Returns:
+        str:
+            The user agent identifying the application with its current name and
+            version.
+    """
+
+    app_name: str = QCoreApplication.applicationName()
+    app_version: str = QCoreApplication.applicationVersion()
+
+    return f"{app_name}/{app_version} ({_get_platform_description()})"
+
+
+@cache
+def _get_platform_description() -> str:
+    """
+    Returns:
+        str:
+            Description of the platform for the user agent, which does not change
+            while the application is running.
+    """
+
+    return f"{platform.system()} {platform.version()}; {platform.architecture()[0]}"
@@ -5,47 +5,172 @@ Script to compile marked Python modules using mypyc.
 """
 
 import argparse
+import json
 import logging
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterator
+from typing import Any, Iterator, Optional
 
 from cutleast_core_lib.core.utilities.process_runner import run_process
 
 MARKER: str = "# mypyc"
 """Marker that indicates which modules are to be compiled."""
 
+_MARKER_BYTES: bytes = MARKER.encode()
+
 MAX_LINE: int = 10
 """Maximum number of lines to check for the marker."""
 
+HEAD_SIZE: int = 4096
+"""Number of bytes read from the start of each module to check for the marker."""
+
+SCAN_CACHE_FILE: Path = Path("build") / ".mypyc_scan_cache.json"
+"""
+Path to the file caching the scan results between runs, relative to the working
+directory. It is placed in the build folder of mypyc.
+"""
+
 log: logging.Logger = logging.getLogger("MyPyCCompiler")
 
 
-def find_marked_modules(directory: Path) -> Iterator[Path]:
+def find_marked_modules(
+    directory: Path, scan_cache_file: Optional[Path] = None
+) -> Iterator[Path]:
     """
     Recursively finds all Python modules in a directory that contain a '# mypyc' marker.
 
     Args:
         directory (Path): Directory to search recursively.
+        scan_cache_file (Optional[Path], optional):
+            JSON file to cache the scan results in. Modules that were not modified
+            since the last scan are not read again. Defaults to None.
 
     Yields:
         Path: Path to each Python file that should be compiled.
     """
 
-    for path in directory.rglob("*.py"):
-        try:
-            with path.open("r", encoding="utf-8") as file:
-                for ln, line in enumerate(file):
-                    if ln > MAX_LINE:
-                        break
+    paths: list[Path] = list(directory.rglob("*.py"))
+    scan_cache: dict[str, tuple[int, bool]] = (
+        _load_scan_cache(scan_cache_file) if scan_cache_file is not None else {}
+    )
+
+    # Reading the files is I/O-bound, so they are checked in parallel by threads
+    with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 4) as executor:
+        results: list[tuple[int, bool]] = list(
+            executor.map(lambda path: _scan_module(path, scan_cache), paths)
+        )
+
+    if scan_cache_file is not None:
+        # Entries of modules that no longer exist are dropped
+        _save_scan_cache(
+            scan_cache_file,
+            {str(path): result for path, result in zip(paths, results, strict=True)},
+        )
+
+    for path, (_, has_marker) in zip(paths, results, strict=True):
+        if has_marker:
+            yield path
+
+
+def _scan_module(
+    path: Path, scan_cache: dict[str, tuple[int, bool]]
+) -> tuple[int, bool]:
+    """
+    Checks if a Python module contains the marker, using the cached result if the
+    module was not modified since it was cached.
+
+    Args:
+        path (Path): Path to the Python module.
+        scan_cache (dict[str, tuple[int, bool]]):
+            Cached scan results mapped by the module paths.
+
+    Returns:
+        tuple[int, bool]:
+            The modification time of the module in nanoseconds and whether it is
+            marked.
+    """
+
+    try:
+        mtime: int = path.stat().st_mtime_ns
+    except OSError:
+        return -1, False
+
+    cached_result: Optional[tuple[int, bool]] = scan_cache.get(str(path))
+    if cached_result is not None and cached_result[0] == mtime:
+        return cached_result
+
+    return mtime, _has_marker(path)
+
+
+def _load_scan_cache(scan_cache_file: Path) -> dict[str, tuple[int, bool]]:
+    """
+    Loads the cached scan results from a JSON file.
+
+    Args:
+        scan_cache_file (Path): Path to the JSON file.
+
+    Returns:
+        dict[str, tuple[int, bool]]:
+            Cached scan results mapped by the module paths. Empty if the file does
+            not exist or is invalid.
+    """
+
+    try:
+        data: Any = json.loads(scan_cache_file.read_bytes())
+        return {
+            path: (int(mtime), bool(has_marker))
+            for path, (mtime, has_marker) in data.items()
+        }
+    except (OSError, ValueError, TypeError, AttributeError) as ex:
+        log.debug(f"Failed to load scan cache '{scan_cache_file}': {ex}")
+        return {}
+
+
+def _save_scan_cache(
+    scan_cache_file: Path, scan_cache: dict[str, tuple[int, bool]]
+) -> None:
+    """
+    Saves the scan results to a JSON file. The file is replaced atomically.
+
+    Args:
+        scan_cache_file (Path): Path to the JSON file.
+        scan_cache (dict[str, tuple[int, bool]]):
+            Scan results mapped by the module paths.
+    """
+
+    temp_file: Path = scan_cache_file.with_name(scan_cache_file.name + ".tmp")
+    try:
+        scan_cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file.write_text(json.dumps(scan_cache), encoding="utf-8")
+        os.replace(temp_file, scan_cache_file)
+    except OSError as ex:
+        log.warning(f"Failed to save scan cache '{scan_cache_file}': {ex}")
+        temp_file.unlink(missing_ok=True)
+
+
+def _has_marker(path: Path) -> bool:
+    """
+    Checks if a Python module contains the marker in one of its first lines.
+
+    Args:
+        path (Path): Path to the Python module.
+
+    Returns:
+        bool: `True` if the module is marked, `False` otherwise or if it is unreadable.
+    """
 
-                    if line.startswith(MARKER):
-                        yield path
-                        break
+    try:
+        # The marker is searched in the raw bytes of the first lines, so the rest of
+        # the file is neither read nor decoded
+        with path.open("rb") as file:
+            head: bytes = file.read(HEAD_SIZE)
+    except OSError:
+        return False
 
-        except (OSError, UnicodeDecodeError):
-            # Skip unreadable or binary-like files
-            continue
+    lines: list[bytes] = head.split(b"\n", MAX_LINE + 1)[: MAX_LINE + 1]
+    return any(line.startswith(_MARKER_BYTES) for line in lines)
 
 
 def compile_with_mypyc(module_path: Path) -> None:
@@ -78,7 +203,7 @@ def run(args: argparse.Namespace) -> None:
         log.error(f"'{base_dir}' does not exist!")
         sys.exit(1)
 
-    marked_modules = list(find_marked_modules(base_dir))
+    marked_modules = list(find_marked_modules(base_dir, SCAN_CACHE_FILE))
 
     if not marked_modules:
         log.info("No modules marked with '# mypyc' found.")
@@ -86,6 +211,9 @@ def run(args: argparse.Namespace) -> None:
 
     log.info(f"Found {len(marked_modules)} marked module(s). Starting compilation...")
 
+    # Each module is compiled by its own invocation, since mypyc would otherwise
+    # build a shared library for all modules that every compiled module depends on,
+    # instead of a self-contained extension next to each source file
     for module in marked_modules:
         try:
             compile_with_mypyc(module)
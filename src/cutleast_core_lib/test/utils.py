@@ -45,10 +45,7 @@ class Utils:
         else:
             method_name = f"_{obj.__class__.__name__}__{method_name}"
 
-        if not hasattr(obj, method_name):
-            raise AttributeError(f"Method '{method_name}' not found!")
-
-        field: Optional[Any] = getattr(obj, method_name, None)
+        field: Optional[Any] = Utils.__get_attribute(obj, method_name, "Method")
 
         if not callable(field):
             raise TypeError(f"'{method_name}' ({type(field)}) is not callable!")
@@ -105,11 +102,7 @@ class Utils:
         """
 
         field_name = f"_{obj.__class__.__name__}__{field_name}"
-
-        if not hasattr(obj, field_name):
-            raise AttributeError(f"Field '{field_name}' not found!")
-
-        field: Optional[Any] = getattr(obj, field_name, None)
+        field: Optional[Any] = Utils.__get_attribute(obj, field_name, "Field")
 
         if field is not None and not isinstance(
             field, get_origin(field_type) or field_type
@@ -137,17 +130,35 @@ class Utils:
         """
 
         field_name = "_" + field_name
-
-        if not hasattr(obj, field_name):
-            raise AttributeError(f"Field '{field_name}' not found!")
-
-        field: Optional[Any] = getattr(obj, field_name, None)
+        field: Optional[Any] = Utils.__get_attribute(obj, field_name, "Field")
 
         if not isinstance(field, get_origin(field_type) or field_type):
             raise TypeError(f"'{field_name}' ({type(field)}) is not a {field_type}!")
 
         return field  # type: ignore
 
+    @staticmethod
+    def __get_attribute(obj: object, attr_name: str, kind: str) -> Any:
+        """
+        Gets an attribute from an object with a single lookup.
+
+        Args:
+            obj (object): The object to get the attribute from.
+            attr_name (str): The (mangled) name of the attribute.
+            kind (str): Kind of the attribute for the error message.
+
+        Raises:
+            AttributeError: when the attribute is not found.
+
+        Returns:
+            Any: The attribute value.
+        """
+
+        try:
+            return getattr(obj, attr_name)
+        except AttributeError as ex:
+            raise AttributeError(f"{kind} '{attr_name}' not found!") from ex
+
     @staticmethod
     def reset_singleton[S: Singleton](singleton_cls: type[S]) -> None:
         """
@@ -2,9 +2,11 @@
 Copyright (c) Cutleast
 """
 
-from typing import Optional, override
+import time
+from pathlib import Path
+from typing import ClassVar, Optional, override
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import (
     QCheckBox,
     QFormLayout,
@@ -22,6 +24,7 @@ from cutleast_core_lib.core.config.validation_utils import ValidationUtils
 from cutleast_core_lib.core.filesystem.scanner import DirectoryScanner
 from cutleast_core_lib.core.utilities.logger import Logger
 from cutleast_core_lib.core.utilities.scale import scale_value
+from cutleast_core_lib.core.utilities.thread import DaemonThread
 from cutleast_core_lib.ui.utilities.ui_mode import UIMode
 
 from ..widgets.color_edit import ColorLineEdit
@@ -46,37 +49,55 @@ class AppSettings(SettingsPage[AppConfig]):
     __ui_mode_box: EnumDropdown[UIMode]
     __clear_cache_button: QPushButton
 
+    ACCENT_COLOR_DEBOUNCE_INTERVAL: int = 150
+    """
+    Time in milliseconds after the last change of the accent color before the change
+    signals are emitted.
+    """
+
+    __accent_color_timer: QTimer
+
+    CACHE_SIZE_MAX_AGE: float = 60
+    """Time in seconds for which a computed cache size is reused."""
+
+    __cache_sizes: ClassVar[dict[Path, tuple[float, int]]] = {}
+    """Computed cache folder sizes and the times when they were computed."""
+
+    __cache_size_threads: ClassVar[set[DaemonThread[int]]] = set()
+    """
+    Threads computing the cache size. They are kept alive until they finished, even if
+    their page gets deleted before, but do not keep the application from quitting.
+    """
+
+    __cache_size_thread: Optional[DaemonThread[int]] = None
+
     @override
     def __init__(self, initial_config: AppConfig) -> None:
         self.cache = Cache.get_optional()
 
         super().__init__(initial_config)
 
-        self.__logs_num_box.valueChanged.connect(lambda _: self.changed_signal.emit())
-        self.__logs_num_box.valueChanged.connect(
-            lambda _: self.restart_required_signal.emit()
-        )
-        self.__log_level_box.currentValueChanged.connect(
-            lambda _: self.changed_signal.emit()
-        )
-        self.__log_level_box.currentValueChanged.connect(
-            lambda _: self.restart_required_signal.emit()
-        )
-        self.__log_visible.stateChanged.connect(lambda _: self.changed_signal.emit())
-        self.__log_visible.stateChanged.connect(
-            lambda _: self.restart_required_signal.emit()
+        # The signals are forwarded directly by Qt, which drops their arguments
+        for signal in (
+            self.__logs_num_box.valueChanged,
+            self.__log_level_box.currentValueChanged,
+            self.__log_visible.stateChanged,
+            self.__ui_mode_box.currentValueChanged,
+        ):
+            signal.connect(self.changed_signal)
+            signal.connect(self.restart_required_signal)
+
+        # The accent color changes with every keystroke, so the signals are only
+        # emitted once the user stopped typing
+        self.__accent_color_timer = QTimer(self)
+        self.__accent_color_timer.setSingleShot(True)
+        self.__accent_color_timer.setInterval(
+            AppSettings.ACCENT_COLOR_DEBOUNCE_INTERVAL
         )
+        self.__accent_color_timer.timeout.connect(self.changed_signal)
+        self.__accent_color_timer.timeout.connect(self.restart_required_signal)
         self.__accent_color_entry.textChanged.connect(
-            lambda _: self.changed_signal.emit()
-        )
-        self.__accent_color_entry.textChanged.connect(
-            lambda _: self.restart_required_signal.emit()
-        )
-        self.__ui_mode_box.currentValueChanged.connect(
-            lambda _: self.changed_signal.emit()
-        )
-        self.__ui_mode_box.currentValueChanged.connect(
-            lambda _: self.restart_required_signal.emit()
+            lambda _: self.__accent_color_timer.start()
         )
 
         self.__clear_cache_button.setVisible(self.cache is not None)
@@ -133,17 +154,80 @@ class AppSettings(SettingsPage[AppConfig]):
             self.cache is not None and self.cache.path.is_dir()
         )
         if self.cache is not None and self.cache.path.is_dir():
-            self.__clear_cache_button.setText(
-                self.__clear_cache_button.text()
-                + f" ({scale_value(DirectoryScanner.get_folder_size(self.cache.path))})"
-            )
+            self.__request_cache_size(self.cache.path)
         self._basic_flayout.addRow(self.__clear_cache_button)
 
+    def __request_cache_size(self, cache_path: Path) -> None:
+        """
+        Displays the size of the cache folder on the clear cache button. The size is
+        computed in a background thread, unless it was computed recently.
+
+        Args:
+            cache_path (Path): Path to the cache folder.
+        """
+
+        cached_size: Optional[tuple[float, int]] = AppSettings.__cache_sizes.get(
+            cache_path
+        )
+        if (
+            cached_size is not None
+            and time.time() - cached_size[0] <= AppSettings.CACHE_SIZE_MAX_AGE
+        ):
+            self.__set_cache_size(cached_size[1])
+            return
+
+        self.__clear_cache_button.setText(self.tr("Clear Cache") + " (…)")
+
+        thread: DaemonThread[int] = DaemonThread(
+            lambda: DirectoryScanner.get_folder_size(cache_path), "CacheSizeThread"
+        )
+        # The thread is released independently of this page since the page may be
+        # deleted before the thread finished
+        thread.finished.connect(
+            lambda: AppSettings.__on_cache_size_thread_finished(thread, cache_path)
+        )
+        thread.finished.connect(self.__on_cache_size_computed)
+        AppSettings.__cache_size_threads.add(thread)
+        self.__cache_size_thread = thread
+        thread.start()
+
+    @staticmethod
+    def __on_cache_size_thread_finished(
+        thread: DaemonThread[int], cache_path: Path
+    ) -> None:
+        AppSettings.__cache_size_threads.discard(thread)
+
+        # The cache folder is deleted when the cache is cleared in the meantime
+        size: int | Exception = thread.get_result()
+        if not isinstance(size, Exception) and cache_path.is_dir():
+            AppSettings.__cache_sizes[cache_path] = (time.time(), size)
+
+    def __on_cache_size_computed(self) -> None:
+        thread: Optional[DaemonThread[int]] = self.__cache_size_thread
+        if thread is None:
+            return
+
+        self.__cache_size_thread = None
+
+        size: int | Exception = thread.get_result()
+        if isinstance(size, Exception):
+            self.__clear_cache_button.setText(self.tr("Clear Cache"))
+
+        # The cache may have been cleared in the meantime
+        elif self.__clear_cache_button.isEnabled():
+            self.__set_cache_size(size)
+
+    def __set_cache_size(self, size: int) -> None:
+        self.__clear_cache_button.setText(
+            self.tr("Clear Cache") + f" ({scale_value(size)})"
+        )
+
     def __clear_cache(self) -> None:
         if self.cache is None:
             return
 
         self.cache.clear_caches()
+        AppSettings.__cache_sizes.pop(self.cache.path, None)
         self.__clear_cache_button.setText(self.tr("Clear Cache"))
         self.__clear_cache_button.setEnabled(False)
 
@@ -56,3 +56,52 @@ class TestBuildMetadata(BaseTest):
         assert metadata.file_version == "1.0.0.1"
         assert metadata.project_author is None
         assert metadata.project_license is None
+
+    def test_from_pyproject_modified(self, test_fs: FakeFilesystem) -> None:
+        """
+        Tests that `BuildMetadata.from_pyproject()` picks up changes to the
+        pyproject.toml file.
+        """
+
+        # given
+        pyproject_file = Path("test") / "pyproject.toml"
+        pyproject_file.parent.mkdir()
+        pyproject_file.write_text('[project]\nname = "test-project"\nversion = "1.0.0"')
+        old_metadata: BuildMetadata = BuildMetadata.from_pyproject(pyproject_file)
+
+        # when
+        pyproject_file.write_text(
+            '[project]\nname = "test-project"\nversion = "1.0.10"'
+        )
+        new_metadata: BuildMetadata = BuildMetadata.from_pyproject(pyproject_file)
+
+        # then
+        assert BuildMetadata.from_pyproject(pyproject_file) is new_metadata
+        assert old_metadata.project_version == Version("1.0.0")
+        assert new_metadata.project_version == Version("1.0.10")
+
+    def test_from_pyproject_license_modified(self, test_fs: FakeFilesystem) -> None:
+        """
+        Tests that `BuildMetadata.from_pyproject()` picks up changes to the license
+        file even if the pyproject.toml file is unchanged.
+        """
+
+        # given
+        pyproject_file = Path("test") / "pyproject.toml"
+        license_file = Path("test") / "LICENSE"
+        pyproject_file.parent.mkdir()
+        pyproject_file.write_text(
+            '[project]\nname = "test-project"\nversion = "1.0.0"\n'
+            'license = {file = "LICENSE"}'
+        )
+        license_file.write_text("Old License\n")
+        old_metadata: BuildMetadata = BuildMetadata.from_pyproject(pyproject_file)
+
+        # when
+        license_file.write_text("New License Text\n")
+        new_metadata: BuildMetadata = BuildMetadata.from_pyproject(pyproject_file)
+
+        # then
+        assert BuildMetadata.from_pyproject(pyproject_file) is new_metadata
+        assert old_metadata.project_license == "Old License"
+        assert new_metadata.project_license == "New License Text"
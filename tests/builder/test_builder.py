@@ -2,6 +2,7 @@
 Copyright (c) Cutleast
 """
 
+import zipfile
 from pathlib import Path
 from typing import Optional, override
 
@@ -39,7 +40,9 @@ class TestBuilder(BaseTest):
         raise NotImplementedError
 
     @staticmethod
-    def copy_external_resources_stub() -> None:
+    def copy_external_resources_stub(
+        files: dict[Path, Path], dist_folder: Path
+    ) -> None:
         """
         Stub for `Builder.__copy_external_resources()`.
         """
@@ -154,3 +157,103 @@ class TestBuilder(BaseTest):
             ),
             Path("res") / "style.qss": Path("res") / "style.qss",
         }
+
+    def test_archive_dist(self, test_fs: FakeFilesystem, data_folder: Path) -> None:
+        """
+        Tests `Builder.__archive_dist()`.
+        """
+
+        # given
+        config = BuildConfig(exe_stem="test", project_root=data_folder / "test_project")
+        builder = Builder(config, NuitkaBackend())
+        dist_folder: Path = Path("dist") / "test"
+        test_fs.create_file(dist_folder / "test.exe", contents="executable")
+        test_fs.create_file(dist_folder / "res" / "icon.png", contents="image")
+        output_path: Path = Path("dist") / "test.zip"
+
+        # when
+        Utils.get_private_method(
+            builder, "archive_dist", TestBuilder.archive_dist_stub
+        )(dist_folder, output_path)
+
+        # then
+        with zipfile.ZipFile(output_path) as archive:
+            assert sorted(archive.namelist()) == [
+                "test/",
+                "test/res/",
+                "test/res/icon.png",
+                "test/test.exe",
+            ]
+            assert (
+                archive.getinfo("test/test.exe").compress_type == zipfile.ZIP_DEFLATED
+            )
+            assert (
+                archive.getinfo("test/res/icon.png").compress_type == zipfile.ZIP_STORED
+            )
+            assert archive.read("test/test.exe") == b"executable"
+
+    def test_delete_unused_files(
+        self, test_fs: FakeFilesystem, data_folder: Path
+    ) -> None:
+        """
+        Tests `Builder.__delete_unused_files()` with paths and glob patterns.
+        """
+
+        # given
+        dist_folder: Path = Path("dist") / "test"
+        config = BuildConfig(
+            exe_stem="test",
+            project_root=data_folder / "test_project",
+            delete_list=[
+                Path("unused.dll"),
+                Path("missing.dll"),
+                Path("lib"),
+                Path("translations") / "*.qm",
+            ],
+        )
+        builder = Builder(config, NuitkaBackend())
+        test_fs.create_file(dist_folder / "test.exe")
+        test_fs.create_file(dist_folder / "unused.dll")
+        test_fs.create_file(dist_folder / "lib" / "used.dll")
+        test_fs.create_file(dist_folder / "translations" / "de.qm")
+        test_fs.create_file(dist_folder / "translations" / "en.qm")
+        test_fs.create_file(dist_folder / "translations" / "readme.txt")
+
+        # when
+        Utils.get_private_method(
+            builder, "delete_unused_files", TestBuilder.delete_unused_files_stub
+        )(dist_folder)
+
+        # then
+        assert sorted(
+            file.relative_to(dist_folder).as_posix()
+            for file in dist_folder.rglob("*")
+            if file.is_file()
+        ) == ["lib/used.dll", "test.exe", "translations/readme.txt"]
+
+    def test_copy_external_resources(
+        self, test_fs: FakeFilesystem, data_folder: Path
+    ) -> None:
+        """
+        Tests `Builder.__copy_external_resources()`.
+        """
+
+        # given
+        config = BuildConfig(exe_stem="test", project_root=data_folder / "test_project")
+        builder = Builder(config, NuitkaBackend())
+        dist_folder: Path = Path("dist") / "test"
+        files: dict[Path, Path] = {
+            Path("res") / "style.qss": Path("res") / "style.qss",
+            Path("res") / "resources" / "test1.txt": Path("data") / "test1.txt",
+        }
+
+        # when
+        Utils.get_private_method(
+            builder, "copy_external_resources", TestBuilder.copy_external_resources_stub
+        )(files, dist_folder)
+
+        # then
+        for src, dst in files.items():
+            assert (dist_folder / dst).read_bytes() == (
+                config.project_root / src
+            ).read_bytes()
@@ -0,0 +1,62 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import time
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from cutleast_core_lib.core.archive_legacy.zip import ZIPARchive
+
+
+class TestZIPArchive:
+    """
+    Tests `core.archive_legacy.zip.ZIPARchive`.
+    """
+
+    DATE_TIME: tuple[int, int, int, int, int, int] = (2020, 1, 2, 3, 4, 6)
+    """Modification time of the archived files."""
+
+    def test_extract_all_restores_modification_times(self, tmp_path: Path) -> None:
+        """
+        Tests that `ZIPARchive.extract_all()` restores the modification times of the
+        archived files and folders.
+        """
+
+        # given
+        archive_path: Path = tmp_path / "archive.zip"
+        with zipfile.ZipFile(archive_path, "w") as archive:
+            archive.writestr(zipfile.ZipInfo("folder/", TestZIPArchive.DATE_TIME), "")
+            archive.writestr(
+                zipfile.ZipInfo("folder/file.txt", TestZIPArchive.DATE_TIME), "text"
+            )
+        dest: Path = tmp_path / "dest"
+        expected_mtime: float = time.mktime(TestZIPArchive.DATE_TIME + (0, 0, -1))
+
+        # when
+        ZIPARchive(archive_path).extract_all(dest)
+
+        # then
+        assert (dest / "folder" / "file.txt").read_text() == "text"
+        assert (dest / "folder" / "file.txt").stat().st_mtime == expected_mtime
+        assert (dest / "folder").stat().st_mtime == expected_mtime
+
+    def test_extract_wraps_write_errors(self, tmp_path: Path) -> None:
+        """
+        Tests that `ZIPARchive.extract()` raises a `RuntimeError` when a file cannot
+        be written.
+        """
+
+        # given
+        archive_path: Path = tmp_path / "archive.zip"
+        with zipfile.ZipFile(archive_path, "w") as archive:
+            archive.writestr("folder/file.txt", "text")
+        dest: Path = tmp_path / "dest"
+        dest.mkdir()
+        (dest / "folder").write_text("not a folder")
+
+        # when/then
+        with pytest.raises(RuntimeError):
+            ZIPARchive(archive_path).extract("folder/file.txt", dest)
@@ -4,11 +4,13 @@ Copyright (c) Cutleast
 
 import time
 from pathlib import Path
+from typing import Any
 
 import pytest
 
 from cutleast_core_lib.core.cache.cache import Cache
 from cutleast_core_lib.test.base_test import BaseTest
+from cutleast_core_lib.test.utils import Utils
 
 
 class TestCache(BaseTest):
@@ -95,6 +97,126 @@ class TestCache(BaseTest):
         assert result1 == result2 == result3 == 3
         assert (cache.path / cache_subfolder / (cache_file_name + ".cache")).is_file()
 
+    def test_get_from_cache_after_modification(self, cache: Cache) -> None:
+        """
+        Tests that `core.cache.cache.Cache.get_from_cache()` returns the in-memory data
+        until the cache file gets modified.
+        """
+
+        # given
+        cache_file_path: Path = Path("test_modification") / "data.cache"
+        Cache.save_to_cache(cache_file_path, {"value": 1})
+
+        # when
+        result1: dict[str, int] = Cache.get_from_cache(cache_file_path)
+        result2: dict[str, int] = Cache.get_from_cache(cache_file_path)
+
+        # then
+        assert result1 == {"value": 1}
+        assert result1 is result2
+
+        # when
+        Cache.save_to_cache(cache_file_path, {"value": 22})
+        result3: dict[str, int] = Cache.get_from_cache(cache_file_path)
+
+        # then
+        assert result3 == {"value": 22}
+
+    def test_invalidate(self, cache: Cache) -> None:
+        """
+        Tests `core.cache.cache.Cache.invalidate()` with a single file and a folder.
+        """
+
+        # given
+        cache_file_path: Path = Path("test_invalidate") / "data.cache"
+        nested_file_path: Path = Path("test_invalidate") / "nested" / "data.cache"
+        Cache.save_to_cache(cache_file_path, 1)
+        Cache.save_to_cache(nested_file_path, 2)
+        assert Cache.get_from_cache(cache_file_path) == 1
+        assert Cache.get_from_cache(nested_file_path) == 2
+
+        # when
+        Cache.invalidate(cache_file_path)
+
+        # then
+        assert Cache.get_from_cache(cache_file_path, default=None) is None
+        assert Cache.get_from_cache(nested_file_path) == 2
+
+        # when
+        Cache.invalidate(Path("test_invalidate"), prefix=True)
+
+        # then
+        assert Cache.get_from_cache(nested_file_path, default=None) is None
+        assert not (cache.path / "test_invalidate").exists()
+
+    def test_persistent_cache_depends_on(self, cache: Cache) -> None:
+        """
+        Tests that the `core.cache.cache.Cache.persistent_cache`-decorator function
+        invalidates the cache files specified with `depends_on`.
+        """
+
+        # given
+        dependent_file_path: Path = Path("test_dependent") / "data.cache"
+        Cache.save_to_cache(dependent_file_path, "outdated")
+
+        @Cache.persistent_cache(
+            cache_subfolder=Path("test_depends_on"),
+            id_generator=lambda x: str(x),
+            depends_on=[Path("test_dependent")],
+        )
+        def test_function(x: int) -> int:
+            return x * 2
+
+        # when
+        result: int = test_function(2)
+
+        # then
+        assert result == 4
+        assert Cache.get_from_cache(dependent_file_path, default=None) is None
+
+    CACHE_ROUNDTRIP_TEST_DATA: list[Any] = [
+        {"name": "test", "values": [1, 2.5, True, None]},
+        {"tuple": (1, 2)},
+        {1: "int key"},
+        [float("nan")],
+        2**100,
+        {"set": {1, 2}},
+    ]
+
+    @pytest.mark.parametrize("data", CACHE_ROUNDTRIP_TEST_DATA)
+    def test_cache_roundtrip(self, data: Any, cache: Cache) -> None:
+        """
+        Tests that data saved with `core.cache.cache.Cache.save_to_cache()` keeps its
+        types when read with `core.cache.cache.Cache.get_from_cache()`.
+        """
+
+        # given
+        cache_file_path: Path = Path("test_roundtrip") / "data.cache"
+
+        # when
+        Cache.save_to_cache(cache_file_path, data)
+        result: Any = Cache.get_from_cache(cache_file_path)
+
+        # then
+        assert repr(result) == repr(data)
+
+    def test_get_from_cache_json(self, cache: Cache) -> None:
+        """
+        Tests that `core.cache.cache.Cache.get_from_cache()` reads cache files
+        containing JSON data.
+        """
+
+        # given
+        cache_file_path: Path = Path("test_json") / "data.cache"
+        (cache.path / cache_file_path).parent.mkdir(parents=True)
+        (cache.path / cache_file_path).write_bytes(b'J\x00{"values": [1, 2]}')
+
+        # when
+        result: dict[str, list[int]] = Cache.get_from_cache(cache_file_path)
+
+        # then
+        assert result == {"values": [1, 2]}
+
     def test_multi_instantiation_raises_exception(self, cache: Cache) -> None:
         """
         Tests that instantiating multiple `Cache` instances raises an exception.
@@ -102,3 +224,18 @@ class TestCache(BaseTest):
 
         with pytest.raises(RuntimeError, match="Cache is already initialized!"):
             Cache(Path("test_cache"), "development")
+
+    def test_get_from_cache_without_instance(self) -> None:
+        """
+        Tests that `core.cache.cache.Cache.get_from_cache()` returns the default value
+        without a cache instance.
+        """
+
+        # given
+        Utils.reset_singleton(Cache)
+
+        # when
+        result: str = Cache.get_from_cache(Path("missing.cache"), default="default")
+
+        # then
+        assert result == "default"
@@ -0,0 +1,36 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import pytest
+
+from cutleast_core_lib.core.config.validation_utils import ValidationUtils
+
+
+class TestValidationUtils:
+    """
+    Tests `core.config.validation_utils.ValidationUtils`.
+    """
+
+    HEX_COLOR_TEST_DATA: list[tuple[str, bool]] = [
+        ("#1a2B3c", True),
+        ("#1a2B3cFf", True),
+        ("1a2b3c", False),
+        ("#1a2b3", False),
+        ("#1a2b3g", False),
+        ("#+1a2b3", False),
+        ("#1a_2b3", False),
+        ("#", False),
+    ]
+
+    @pytest.mark.parametrize("color_code, expected_result", HEX_COLOR_TEST_DATA)
+    def test_is_valid_hex_color(self, color_code: str, expected_result: bool) -> None:
+        """
+        Tests `ValidationUtils.is_valid_hex_color()`.
+        """
+
+        # when
+        real_result: bool = ValidationUtils.is_valid_hex_color(color_code)
+
+        # then
+        assert real_result == expected_result
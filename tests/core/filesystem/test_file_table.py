@@ -0,0 +1,43 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from pathlib import Path
+
+from pyfakefs.fake_filesystem import FakeFilesystem
+
+from cutleast_core_lib.core.filesystem.file import File
+from cutleast_core_lib.core.filesystem.file_table import FileTable
+from cutleast_core_lib.core.filesystem.scanner import DirectoryScanner
+from cutleast_core_lib.test.base_test import BaseTest
+
+
+class TestFileTable(BaseTest):
+    """
+    Tests `core.filesystem.file_table.FileTable`.
+    """
+
+    def test_scan_folder_table(self, test_fs: FakeFilesystem) -> None:
+        """
+        Tests that `DirectoryScanner.scan_folder_table()` returns the same files as
+        `DirectoryScanner.scan_folder()`.
+        """
+
+        # given
+        base = Path("C:/table")
+        (base / "nested").mkdir(parents=True)
+        (base / "a.bin").write_text("abcd")
+        (base / "nested" / "b.bin").write_text("123456")
+
+        # when
+        table: FileTable = DirectoryScanner.scan_folder_table(base)
+        files: list[File] = DirectoryScanner.scan_folder(base)
+
+        # then
+        assert len(table) == 2
+        assert sum(table.sizes) == 10
+        assert set(table.paths) == {base / "a.bin", base / "nested" / "b.bin"}
+        assert {table.to_file(i) for i in range(len(table))} == set(files)
+        assert {
+            (file.path, file.size, file.last_modified) for file in table.to_files()
+        } == {(file.path, file.size, file.last_modified) for file in files}
@@ -70,6 +70,59 @@ class TestDirectoryScanner(BaseTest):
         assert top_file in paths
         assert deep_file in paths
 
+    def test_scan_folder_order(self, test_fs: FakeFilesystem) -> None:
+        """
+        Tests that the folders are scanned depth-first in the order they are listed and
+        that the files of a folder come before the files of its subfolders.
+        """
+
+        # given
+        base = Path("C:/root")
+        for folder in ["a", "a/x", "b", "c"]:
+            (base / folder).mkdir(parents=True)
+        expected: list[Path] = [
+            base / "top.txt",
+            base / "a" / "1.txt",
+            base / "a" / "x" / "2.txt",
+            base / "b" / "3.txt",
+            base / "c" / "4.txt",
+        ]
+        for file in expected:
+            file.write_text("x")
+
+        # when
+        result: list[File] = DirectoryScanner.scan_folder(base)
+        parallel_result: list[File] = DirectoryScanner.scan_folder(base, parallel=True)
+
+        # then
+        assert [f.path for f in result] == expected
+        assert [f.path for f in parallel_result] == expected
+
+    def test_scan_folder_parallel(self, test_fs: FakeFilesystem) -> None:
+        """
+        Tests that parallel scanning returns the same files as sequential scanning.
+        """
+
+        # given
+        base = Path("C:/root")
+        base.mkdir(parents=True)
+        (base / "top.txt").write_text("1")
+
+        for name in ["a", "b", "c"]:
+            nested: Path = base / name / "nested"
+            nested.mkdir(parents=True)
+            (base / name / "file.txt").write_text(name)
+            (nested / "deep.txt").write_text(name)
+
+        # when
+        expected: set[Path] = {f.path for f in DirectoryScanner.scan_folder(base)}
+        result: list[File] = DirectoryScanner.scan_folder(base, parallel=True)
+        paths: set[Path] = {f.path for f in result}
+
+        # then
+        assert len(result) == 7
+        assert paths == expected
+
     def test_scan_folder_propagates_error(
         self, test_fs: FakeFilesystem, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -116,6 +169,79 @@ class TestDirectoryScanner(BaseTest):
         assert text1_file in paths
         assert text2_file in paths
 
+    GLOB_FOLDER_SIMPLE_PATTERN_TEST_DATA: list[tuple[str, bool, set[str]]] = [
+        ("*.txt", True, {"a.txt"}),
+        ("**/*.txt", True, {"a.txt", "sub/b.txt"}),
+        ("**/*.txt", False, {"a.txt"}),
+        ("a.txt", True, {"a.txt"}),
+        ("b.txt", True, set()),
+        ("**/b.txt", True, {"sub/b.txt"}),
+        ("**/*.png", True, {"sub/c.png"}),
+        ("*.zip", True, set()),
+    ]
+
+    @pytest.mark.parametrize(
+        "pattern, recursive, expected", GLOB_FOLDER_SIMPLE_PATTERN_TEST_DATA
+    )
+    def test_glob_folder_simple_pattern(
+        self, pattern: str, recursive: bool, expected: set[str], test_fs: FakeFilesystem
+    ) -> None:
+        """
+        Tests `glob_folder` with simple patterns that are matched while scanning.
+        """
+
+        # given
+        base = Path("C:/glob")
+        (base / "sub").mkdir(parents=True)
+        (base / "a.txt").write_text("a")
+        (base / "sub" / "b.txt").write_text("b")
+        (base / "sub" / "c.png").write_text("c")
+
+        # when
+        result: list[File] = DirectoryScanner.glob_folder(
+            base, pattern=pattern, recursive=recursive
+        )
+        paths: set[Path] = {f.path for f in result}
+
+        # then
+        assert paths == {base / path for path in expected}
+
+    GLOB_FOLDER_RELATIVE_PATTERN_TEST_DATA: list[tuple[str, bool, set[str]]] = [
+        ("sub/*.txt", True, {"sub/b.txt"}),
+        ("sub/*.txt", False, set()),
+        ("*/b.txt", True, {"sub/b.txt"}),
+        ("sub/**/*.txt", True, {"sub/b.txt", "sub/deep/d.txt"}),
+        ("**/deep/*", True, {"sub/deep/d.txt"}),
+        ("*.t?t", True, {"a.txt"}),
+    ]
+
+    @pytest.mark.parametrize(
+        "pattern, recursive, expected", GLOB_FOLDER_RELATIVE_PATTERN_TEST_DATA
+    )
+    def test_glob_folder_relative_pattern(
+        self, pattern: str, recursive: bool, expected: set[str], test_fs: FakeFilesystem
+    ) -> None:
+        """
+        Tests that `glob_folder` matches other patterns against the paths relative to
+        the folder.
+        """
+
+        # given
+        base = Path("C:/glob")
+        (base / "sub" / "deep").mkdir(parents=True)
+        (base / "a.txt").write_text("a")
+        (base / "sub" / "b.txt").write_text("b")
+        (base / "sub" / "deep" / "d.txt").write_text("d")
+
+        # when
+        result: list[File] = DirectoryScanner.glob_folder(
+            base, pattern=pattern, recursive=recursive
+        )
+        paths: set[Path] = {f.path for f in result}
+
+        # then
+        assert paths == {base / path for path in expected}
+
     def test_get_folder_size(self, test_fs: FakeFilesystem) -> None:
         """
         Tests that `get_folder_size` returns the sum of file sizes.
@@ -132,3 +258,22 @@ class TestDirectoryScanner(BaseTest):
 
         # then
         assert total == 10
+
+    def test_get_folder_size_nested(self, test_fs: FakeFilesystem) -> None:
+        """
+        Tests that `get_folder_size` only includes subfolders when `recursive=True`.
+        """
+
+        # given
+        base = Path("C:/size")
+        (base / "nested").mkdir(parents=True)
+        (base / "a.bin").write_text("abcd")  # size 4
+        (base / "nested" / "b.bin").write_text("123456")  # size 6
+
+        # when
+        total: int = DirectoryScanner.get_folder_size(base)
+        top_level: int = DirectoryScanner.get_folder_size(base, recursive=False)
+
+        # then
+        assert total == 10
+        assert top_level == 4
@@ -2,9 +2,15 @@
 Copyright (c) Cutleast
 """
 
+from pathlib import Path
 from typing import TypeVar
 
-from cutleast_core_lib.core.filesystem.utils import str_glob
+from cutleast_core_lib.core.filesystem.utils import (
+    clean_fs_name,
+    is_folder_empty,
+    str_glob,
+    str_glob_many,
+)
 
 T = TypeVar("T")
 
@@ -76,3 +82,53 @@ class TestFilesystemUtils:
 
         # then
         assert TestFilesystemUtils.compare_lists(real_output, expected_output)
+
+    def test_glob_many(self) -> None:
+        """
+        Tests `str_glob_many()` with multiple patterns.
+        """
+
+        # given
+        patterns: list[str] = ["*.txt", "**/*.PNG", "a.txt"]
+        files: list[str] = ["a.txt", "b/c.png", "d.ini", "e/f/g.png"]
+        expected_output: list[str] = ["a.txt", "b/c.png", "e/f/g.png"]
+
+        # when
+        real_output: list[str] = str_glob_many(patterns, files)
+
+        # then
+        assert real_output == expected_output
+
+    def test_clean_fs_name(self) -> None:
+        """
+        Tests `clean_fs_name()` with illegal characters.
+        """
+
+        # given
+        name: str = 'a:b<c>d?e*f"g|h.txt'
+        expected_output: str = "abcdefgh.txt"
+
+        # when
+        real_output: str = clean_fs_name(name)
+
+        # then
+        assert real_output == expected_output
+
+    def test_is_folder_empty(self, tmp_path: Path) -> None:
+        """
+        Tests `is_folder_empty()` with an empty and a non-empty folder.
+        """
+
+        # given
+        empty_folder: Path = tmp_path / "empty"
+        empty_folder.mkdir()
+        non_empty_folder: Path = tmp_path / "non_empty"
+        (non_empty_folder / "sub").mkdir(parents=True)
+
+        # when
+        empty_result: bool = is_folder_empty(empty_folder)
+        non_empty_result: bool = is_folder_empty(non_empty_folder)
+
+        # then
+        assert empty_result
+        assert not non_empty_result
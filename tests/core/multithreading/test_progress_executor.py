@@ -0,0 +1,159 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from concurrent.futures import Future
+from threading import Event, Semaphore
+from typing import override
+
+from PySide6.QtCore import QObject, Signal, SignalInstance
+
+from cutleast_core_lib.core.multithreading.progress import (
+    ProgressUpdate,
+    UpdateCallback,
+)
+from cutleast_core_lib.core.multithreading.progress_executor import ProgressExecutor
+from cutleast_core_lib.core.utilities.exceptions import TaskCancelledError
+from cutleast_core_lib.ui.progress.display import ProgressDisplay
+
+
+class FakeProgressDisplay(ProgressDisplay, QObject):
+    """
+    Progress display recording all updates instead of displaying them.
+    """
+
+    cancel_signal = Signal()
+
+    main_updates: list[ProgressUpdate]
+    removed_progress_ids: list[int]
+
+    __cancel_event: Event
+
+    @override
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.main_updates = []
+        self.removed_progress_ids = []
+        self.__cancel_event = Event()
+
+    @override
+    def updateMainProgress(self, payload: ProgressUpdate) -> None:
+        if self.__cancel_event.is_set():
+            raise TaskCancelledError
+
+        self.main_updates.append(payload)
+
+    @override
+    def updateProgress(self, progress_id: int, payload: ProgressUpdate) -> None:
+        if self.__cancel_event.is_set():
+            raise TaskCancelledError
+
+    @override
+    def cancel(self) -> None:
+        self.__cancel_event.set()
+        self.cancel_signal.emit()
+
+    @property
+    @override
+    def cancelled(self) -> SignalInstance:
+        return self.cancel_signal
+
+    @override
+    def resetCancel(self) -> None:
+        self.__cancel_event.clear()
+
+    @override
+    def removeProgress(self, progress_id: int) -> None:
+        self.removed_progress_ids.append(progress_id)
+
+    @override
+    def clearProgressBars(self) -> None:
+        pass
+
+
+class TestProgressExecutor:
+    """
+    Tests `core.multithreading.progress_executor.ProgressExecutor`.
+    """
+
+    def test_submit(self) -> None:
+        """
+        Tests that the main progress displays the number of completed tasks in order
+        and that the progress bars of the workers are removed after the last task.
+        """
+
+        # given
+        display = FakeProgressDisplay()
+
+        def task(update: UpdateCallback, value: int) -> int:
+            update(ProgressUpdate(value=value, maximum=100))
+            return value * 2
+
+        # when
+        with ProgressExecutor(display, max_workers=4) as executor:
+            executor.set_main_progress_text("Processing {tasks}")
+            futures: list[Future[int]] = [
+                executor.submit(task, value) for value in range(100)
+            ]
+            results: list[int] = [future.result() for future in futures]
+
+        # then
+        assert results == [value * 2 for value in range(100)]
+        values: list[int] = [update.value or 0 for update in display.main_updates]
+        assert values == sorted(values)
+        assert display.main_updates[-1].value == 100
+        assert display.main_updates[-1].maximum == 100
+        assert display.main_updates[-1].status_text == "Processing {tasks} (100 / 100)"
+        assert display.removed_progress_ids
+
+    def test_submit_without_display(self) -> None:
+        """
+        Tests that tasks are run if there is no progress display.
+        """
+
+        # given
+        def task(update: UpdateCallback, value: int) -> int:
+            update(ProgressUpdate(value=value, maximum=100))
+            return value * 2
+
+        # when
+        with ProgressExecutor(max_workers=1) as executor:
+            futures: list[Future[int]] = [
+                executor.submit(task, value) for value in range(10)
+            ]
+            results: list[int] = [future.result() for future in futures]
+
+        # then
+        assert results == [value * 2 for value in range(10)]
+
+    def test_cancel(self) -> None:
+        """
+        Tests that tasks that are still running when the display is cancelled fail with
+        a `TaskCancelledError` and that pending tasks are cancelled.
+        """
+
+        # given
+        display = FakeProgressDisplay()
+        started = Semaphore(0)
+        release = Event()
+
+        def task(update: UpdateCallback) -> int:
+            started.release()
+            release.wait(timeout=1)
+            return 1
+
+        with ProgressExecutor(display, max_workers=2) as executor:
+            # Enough tasks so that the main progress is not updated for every task
+            futures: list[Future[int]] = [executor.submit(task) for _ in range(400)]
+            assert started.acquire(timeout=1) and started.acquire(timeout=1)
+
+            # when
+            display.cancel()
+            release.set()
+
+        # then
+        running_futures: list[Future[int]] = [f for f in futures if not f.cancelled()]
+        assert len(running_futures) == 2
+        for future in running_futures:
+            assert isinstance(future.exception(), TaskCancelledError)
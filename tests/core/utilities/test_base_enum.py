@@ -0,0 +1,63 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from typing import Optional
+
+from cutleast_core_lib.core.utilities.base_enum import BaseEnum
+
+
+class Color(BaseEnum):
+    """
+    Enum used for testing `core.utilities.base_enum.BaseEnum`.
+    """
+
+    Red = "red"
+    Green = "green"
+
+
+class TestBaseEnum:
+    """
+    Tests `core.utilities.base_enum`.
+    """
+
+    def test_get(self) -> None:
+        """
+        Tests `core.utilities.base_enum.BaseEnum.get()` with existing and missing names.
+        """
+
+        # when
+        existing: Optional[Color] = Color.get("Red")
+        missing: Color | str = Color.get("Blue", "default")
+
+        # then
+        assert existing is Color.Red
+        assert missing == "default"
+
+    def test_get_by_value(self) -> None:
+        """
+        Tests `core.utilities.base_enum.BaseEnum.get_by_value()` with existing and
+        missing values.
+        """
+
+        # when
+        existing: Optional[Color] = Color.get_by_value("green")
+        missing: Optional[Color] = Color.get_by_value("blue")
+        default: Color | int = Color.get_by_value("blue", 0)
+
+        # then
+        assert existing is Color.Green
+        assert missing is None
+        assert default == 0
+
+    def test_get_by_value_unhashable(self) -> None:
+        """
+        Tests `core.utilities.base_enum.BaseEnum.get_by_value()` with an unhashable
+        value.
+        """
+
+        # when
+        result: Color | str = Color.get_by_value(["red"], "default")
+
+        # then
+        assert result == "default"
@@ -0,0 +1,103 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from typing import Any
+
+from pydantic import Field
+
+from cutleast_core_lib.core.utilities.dynamic_default_model import (
+    DYNAMIC,
+    DynamicDefaultModel,
+    default_factory,
+)
+
+
+class BaseModelWithFactory(DynamicDefaultModel):
+    """
+    Model used for testing `core.utilities.dynamic_default_model`.
+    """
+
+    name: str = Field(default=DYNAMIC)
+    count: int = 0
+
+    @default_factory("name")
+    @classmethod
+    def _get_default_name(cls) -> str:
+        return cls.__name__
+
+
+class InheritingModel(BaseModelWithFactory):
+    """
+    Model inheriting the default factory of `BaseModelWithFactory`.
+    """
+
+
+class OverridingModel(BaseModelWithFactory):
+    """
+    Model overriding the default factory of `BaseModelWithFactory`.
+    """
+
+    @default_factory("count")
+    @staticmethod
+    def _get_default_count() -> int:
+        return 42
+
+
+class StaticModel(DynamicDefaultModel):
+    """
+    Model without any dynamic default factories.
+    """
+
+    name: str = "static"
+
+
+class TestDynamicDefaultModel:
+    """
+    Tests `core.utilities.dynamic_default_model`.
+    """
+
+    def test_default_factory(self) -> None:
+        """
+        Tests that the marked default factories are used for the fields and bound to
+        the respective subclass.
+        """
+
+        # when
+        base = BaseModelWithFactory()
+        inheriting = InheritingModel()
+        overriding = OverridingModel()
+
+        # then
+        assert base.name == "BaseModelWithFactory"
+        assert base.count == 0
+        assert inheriting.name == "InheritingModel"
+        assert overriding.name == "OverridingModel"
+        assert overriding.count == 42
+
+    def test_dynamic_defaults_are_unset(self) -> None:
+        """
+        Tests that fields with dynamic defaults are not considered as explicitly set.
+        """
+
+        # when
+        dumped: dict[str, Any] = OverridingModel().model_dump(exclude_unset=True)
+        explicit: dict[str, Any] = OverridingModel(name="test").model_dump(
+            exclude_unset=True
+        )
+
+        # then
+        assert dumped == {}
+        assert explicit == {"name": "test"}
+
+    def test_model_without_factories(self) -> None:
+        """
+        Tests that models without dynamic default factories keep their static defaults.
+        """
+
+        # when
+        model = StaticModel()
+
+        # then
+        assert model.name == "static"
+        assert StaticModel.__dynamic_default_factories__ == {}
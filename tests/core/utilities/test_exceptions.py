@@ -0,0 +1,69 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from typing import override
+
+from pytestqt.qtbot import QtBot
+
+from cutleast_core_lib.core.utilities.exceptions import (
+    LocalizedException,
+    Non200HttpError,
+    RequestError,
+)
+
+
+class InstanceDependentError(LocalizedException):
+    """
+    Exception with a localized message depending on the instance.
+    """
+
+    def __init__(self, message: str) -> None:
+        self.message = message
+
+        super().__init__()
+
+    @override
+    def getLocalizedMessage(self) -> str:
+        return self.message
+
+
+class TestExceptions:
+    """
+    Tests `core.utilities.exceptions`.
+    """
+
+    def test_localized_message_is_formatted_per_instance(self, qtbot: QtBot) -> None:
+        """
+        Tests that the cached localized message of
+        `core.utilities.exceptions.LocalizedException` is formatted with the values of
+        each instance.
+        """
+
+        # when
+        first_error = RequestError("https://example.com/a")
+        second_error = RequestError("https://example.com/b")
+        status_error = Non200HttpError("https://example.com/c", 404)
+
+        # then
+        assert str(first_error) == "Request to 'https://example.com/a' failed!"
+        assert str(second_error) == "Request to 'https://example.com/b' failed!"
+        assert (
+            str(status_error)
+            == "Request to 'https://example.com/c' failed with status code 404!"
+        )
+
+    def test_localized_message_is_not_cached_by_default(self, qtbot: QtBot) -> None:
+        """
+        Tests that the localized message of
+        `core.utilities.exceptions.LocalizedException` is only cached for classes that
+        opt in to it.
+        """
+
+        # when
+        first_error = InstanceDependentError("first")
+        second_error = InstanceDependentError("second")
+
+        # then
+        assert str(first_error) == "first"
+        assert str(second_error) == "second"
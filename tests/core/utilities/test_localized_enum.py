@@ -0,0 +1,60 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from typing import override
+
+import pytest
+
+from cutleast_core_lib.core.utilities.localized_enum import LocalizedEnum
+
+
+class Fruit(LocalizedEnum):
+    """
+    Enum used for testing `core.utilities.localized_enum.LocalizedEnum`.
+    """
+
+    Apple = "apple"
+    Banana = "banana"
+
+    @override
+    def get_localized_name(self) -> str:
+        return {Fruit.Apple: "Apfel", Fruit.Banana: "Banane"}[self]
+
+    @override
+    def get_localized_description(self) -> str:
+        return {Fruit.Apple: "Apfel", Fruit.Banana: "Gelb"}[self]
+
+
+class TestLocalizedEnum:
+    """
+    Tests `core.utilities.localized_enum`.
+    """
+
+    def test_get_by_localized_name(self) -> None:
+        """
+        Tests `core.utilities.localized_enum.LocalizedEnum.get_by_localized_name()` with
+        existing and missing localized names.
+        """
+
+        # when
+        LocalizedEnum.invalidate_localization_cache()
+        apple: Fruit = Fruit.get_by_localized_name("Apfel")
+        banana: Fruit = Fruit.get_by_localized_name("Banane")
+
+        # then
+        assert apple is Fruit.Apple
+        assert banana is Fruit.Banana
+        with pytest.raises(ValueError):
+            Fruit.get_by_localized_name("Apple")
+
+    def test_get_localized_summary(self) -> None:
+        """
+        Tests `core.utilities.localized_enum.LocalizedEnum.get_localized_summary()`.
+        """
+
+        # when
+        summary: str = Fruit.get_localized_summary()
+
+        # then
+        assert summary == "Apfel\nBanane: Gelb"
@@ -0,0 +1,115 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import pickle
+from typing import Optional
+
+import pytest
+
+from cutleast_core_lib.core.utilities.plain_enum import PlainEnum
+
+
+class Color(PlainEnum):
+    """
+    Enum used for testing `core.utilities.plain_enum.PlainEnum`.
+    """
+
+    Red = "red"
+    Green = "green"
+
+    @property
+    def upper_value(self) -> str:
+        return str(self.value).upper()
+
+
+class TestPlainEnum:
+    """
+    Tests `core.utilities.plain_enum`.
+    """
+
+    def test_members(self) -> None:
+        """
+        Tests the members created by `core.utilities.plain_enum.PlainEnum`.
+        """
+
+        # then
+        assert isinstance(Color.Red, Color)
+        assert Color.Red.name == "Red"
+        assert Color.Red.value == "red"
+        assert Color.Green.upper_value == "GREEN"  # pyright: ignore[reportAttributeAccessIssue]
+        assert list(Color) == [Color.Red, Color.Green]
+        assert len(Color) == 2
+        assert dict(Color.__members__) == {"Red": Color.Red, "Green": Color.Green}
+        assert Color.Red in Color
+        assert repr(Color.Green) == "Green"
+
+    def test_get(self) -> None:
+        """
+        Tests `core.utilities.plain_enum.PlainEnum.get()` and
+        `core.utilities.plain_enum.PlainEnum.get_by_value()`.
+        """
+
+        # when
+        by_name: Optional[Color] = Color.get("Red")
+        by_value: Optional[Color] = Color.get_by_value("green")
+        missing: Color | str = Color.get_by_value("blue", "default")
+        unhashable: Optional[Color] = Color.get_by_value(["red"])
+
+        # then
+        assert by_name is Color.Red
+        assert by_value is Color.Green
+        assert missing == "default"
+        assert unhashable is None
+
+    def test_members_are_immutable(self) -> None:
+        """
+        Tests that members of a `core.utilities.plain_enum.PlainEnum` can neither be
+        modified nor reassigned nor created.
+        """
+
+        # then
+        with pytest.raises(AttributeError):
+            Color.Red.value = "blue"  # pyright: ignore[reportAttributeAccessIssue]
+
+        with pytest.raises(AttributeError):
+            Color.Red = Color.Green
+
+        with pytest.raises(TypeError):
+            Color()
+
+    def test_pickle(self) -> None:
+        """
+        Tests that members of a `core.utilities.plain_enum.PlainEnum` keep their
+        identity when pickled.
+        """
+
+        # when
+        result: Color = pickle.loads(pickle.dumps(Color.Green))
+
+        # then
+        assert result is Color.Green
+
+    def test_get_by_value_contiguous_ints(self) -> None:
+        """
+        Tests `core.utilities.plain_enum.PlainEnum.get_by_value()` with contiguous
+        integer values.
+        """
+
+        # given
+        class Level(PlainEnum):
+            Low = 0
+            Medium = 1
+            High = 2
+
+        # when
+        medium: Optional[Level] = Level.get_by_value(1)
+        out_of_range: Optional[Level] = Level.get_by_value(3)
+        negative: Optional[Level] = Level.get_by_value(-1)
+        equal_float: Optional[Level] = Level.get_by_value(2.0)
+
+        # then
+        assert medium is Level.Medium
+        assert out_of_range is None
+        assert negative is None
+        assert equal_float is Level.High
@@ -0,0 +1,41 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from typing import Any, Literal
+
+from pydantic import BaseModel
+
+from cutleast_core_lib.core.utilities.pydantic_utils import include_literal_defaults
+
+
+@include_literal_defaults
+class Node(BaseModel):
+    """
+    Model used for testing `core.utilities.pydantic_utils.include_literal_defaults`.
+    """
+
+    type: Literal["node"] = "node"
+    name: str = "default"
+
+
+class TestPydanticUtils:
+    """
+    Tests `core.utilities.pydantic_utils`.
+    """
+
+    def test_include_literal_defaults(self) -> None:
+        """
+        Tests that `core.utilities.pydantic_utils.include_literal_defaults` includes
+        Literal fields when serializing with `exclude_defaults=True`.
+        """
+
+        # when
+        dumped: dict[str, Any] = Node().model_dump(exclude_defaults=True)
+        dumped_with_name: dict[str, Any] = Node(name="test").model_dump(
+            exclude_defaults=True
+        )
+
+        # then
+        assert dumped == {"type": "node"}
+        assert dumped_with_name == {"type": "node", "name": "test"}
@@ -47,3 +47,49 @@ class TestReferenceDict:
 
         with pytest.raises(KeyError):
             regular_dict[test_object]
+
+    def test_remove_keys(self) -> None:
+        """
+        Tests that removing keys from a `core.utilities.reference_dict.ReferenceDict`
+        removes both the key and its value.
+        """
+
+        # given
+        key_a: list[int] = [1]
+        key_b: list[int] = [1]
+        key_c: list[int] = [2]
+        test_dict: ReferenceDict[list[int], str] = ReferenceDict()
+        test_dict[key_a] = "a"
+        test_dict[key_b] = "b"
+        test_dict[key_c] = "c"
+
+        # when
+        del test_dict[key_a]
+        popped: str = test_dict.pop(key_c)
+
+        # then
+        assert popped == "c"
+        assert len(test_dict) == 1
+        assert key_a not in test_dict
+        assert list(test_dict.items()) == [(key_b, "b")]
+        assert test_dict.pop(key_c, None) is None
+
+    def test_iteration(self) -> None:
+        """
+        Tests iterating over the keys and values of a
+        `core.utilities.reference_dict.ReferenceDict` in insertion order.
+        """
+
+        # given
+        key_a: list[int] = [1]
+        key_b: list[int] = [1]
+        test_dict: ReferenceDict[list[int], str] = ReferenceDict()
+
+        # when
+        test_dict[key_a] = "a"
+        test_dict[key_b] = "b"
+
+        # then
+        assert [key is key_a for key in test_dict] == [True, False]
+        assert list(test_dict.values()) == ["a", "b"]
+        assert list(test_dict.keys())[1] is key_b
@@ -0,0 +1,29 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from cutleast_core_lib.core.utilities.reverse_dict import reverse_dict
+
+
+class TestReverseDict:
+    """
+    Tests `core.utilities.reverse_dict`.
+    """
+
+    def test_reverse_dict(self) -> None:
+        """
+        Tests `core.utilities.reverse_dict.reverse_dict()` with unique and duplicate
+        values.
+        """
+
+        # given
+        unique: dict[str, int] = {"a": 1, "b": 2}
+        duplicates: dict[str, int] = {"a": 1, "b": 1}
+
+        # when
+        reversed_unique: dict[int, str] = reverse_dict(unique)
+        reversed_duplicates: dict[int, str] = reverse_dict(duplicates)
+
+        # then
+        assert reversed_unique == {1: "a", 2: "b"}
+        assert reversed_duplicates == {1: "b"}
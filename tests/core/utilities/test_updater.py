@@ -3,9 +3,12 @@ Copyright (c) Cutleast
 """
 
 import pytest
+from pytestqt.qtbot import QtBot
 from requests_mock import Mocker as RequestsMocker
 
+from cutleast_core_lib.core.cache.cache import Cache
 from cutleast_core_lib.core.utilities.exceptions import Non200HttpError
+from cutleast_core_lib.core.utilities.thread import DaemonThread
 from cutleast_core_lib.core.utilities.updater import Updater
 from cutleast_core_lib.test.base_test import BaseTest
 from cutleast_core_lib.test.utils import Utils
@@ -16,6 +19,15 @@ class TestUpdater(BaseTest):
     Tests `core.utilities.updater.Updater`.
     """
 
+    UPDATE_THREAD: tuple[str, type[DaemonThread]] = ("update_thread", DaemonThread)
+    """Identifier for accessing the private update_thread field."""
+
+    CHANGELOG_THREAD: tuple[str, type[DaemonThread]] = (
+        "changelog_thread",
+        DaemonThread,
+    )
+    """Identifier for accessing the private changelog_thread field."""
+
     def test_is_update_available(self, requests_mock: RequestsMocker) -> None:
         """
         Tests `Updater.is_update_available`.
@@ -76,6 +88,43 @@ class TestUpdater(BaseTest):
         # cleanup
         Utils.reset_singleton(Updater)
 
+    def test_is_update_available_with_comments(
+        self, requests_mock: RequestsMocker
+    ) -> None:
+        """
+        Tests `Updater.is_update_available` with an update.json containing comments.
+        """
+
+        # given
+        updater = Updater(
+            repo_name="cutleast-core-lib",
+            repo_branch="main",
+            repo_owner="Cutleast",
+            installed_version="0.0.1",
+        )
+
+        # mock response
+        requests_mock.get(
+            "https://raw.githubusercontent.com/Cutleast/cutleast-core-lib/main/update.json",
+            text=(
+                "{\n"
+                "    // Latest release\n"
+                '    "version": "0.0.2",\n'
+                '    "download_url": "https://github.com/Cutleast/cutleast-core-lib"\n'
+                "}"
+            ),
+        )
+
+        # when
+        result: bool = updater.is_update_available()
+
+        # then
+        assert result
+        assert updater.download_url == "https://github.com/Cutleast/cutleast-core-lib"
+
+        # cleanup
+        Utils.reset_singleton(Updater)
+
     def test_get_changelog(self, requests_mock: RequestsMocker) -> None:
         """
         Tests `Updater.get_changelog`.
@@ -118,3 +167,59 @@ class TestUpdater(BaseTest):
 
         # cleanup
         Utils.reset_singleton(Updater)
+
+    def test_run_reuses_last_check(
+        self, qtbot: QtBot, requests_mock: RequestsMocker, cache: Cache
+    ) -> None:
+        """
+        Tests that `Updater.run` checks for updates in the background, only requests
+        the changelog if an update is available and does not request the update info
+        again if it was checked recently.
+        """
+
+        # given
+        updater = Updater(
+            repo_name="cutleast-core-lib",
+            repo_branch="main",
+            repo_owner="Cutleast",
+            installed_version="0.0.2",
+        )
+
+        # mock responses
+        requests_mock.get(
+            "https://raw.githubusercontent.com/Cutleast/cutleast-core-lib/main/update.json",
+            json={
+                "version": "0.0.2",
+                "download_url": "https://github.com/Cutleast/cutleast-core-lib/releases/download/0.0.2/cutleast-core-lib-0.0.2-py3-none-any.whl",
+            },
+        )
+        requests_mock.get(
+            "https://raw.githubusercontent.com/Cutleast/cutleast-core-lib/main/Changelog.md",
+            text="# Changelog",
+        )
+
+        # when
+        updater.run()
+        qtbot.waitUntil(
+            lambda: (
+                Utils.get_private_field_optional(updater, *TestUpdater.UPDATE_THREAD)
+                is None
+            ),
+            timeout=1000,
+        )
+        updater.run()
+
+        # then
+        assert (
+            Utils.get_private_field_optional(updater, *TestUpdater.UPDATE_THREAD)
+            is None
+        )
+        assert (
+            Utils.get_private_field_optional(updater, *TestUpdater.CHANGELOG_THREAD)
+            is None
+        )
+        assert requests_mock.call_count == 1
+        assert str(updater.latest_version) == "0.0.2"
+
+        # cleanup
+        Utils.reset_singleton(Updater)
@@ -0,0 +1,125 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from pathlib import Path
+
+from PySide6.QtCore import QCoreApplication
+from requests_mock import Mocker as RequestsMocker
+
+from cutleast_core_lib.core.cache.cache import Cache
+from cutleast_core_lib.core.utilities.hash import blake2b_hash
+from cutleast_core_lib.core.utilities.web_utils import (
+    WEB_CACHE_FOLDER,
+    CachedWebContent,
+    get_raw_web_content,
+    get_raw_web_content_uncached,
+    update_user_agent,
+)
+from cutleast_core_lib.test.base_test import BaseTest
+
+
+class TestWebUtils(BaseTest):
+    """
+    Tests `core.utilities.web_utils`.
+    """
+
+    URL: str = (
+        "https://raw.githubusercontent.com/Cutleast/cutleast-core-lib/main/update.json"
+    )
+
+    def test_get_raw_web_content(
+        self, cache: Cache, requests_mock: RequestsMocker
+    ) -> None:
+        """
+        Tests that `core.utilities.web_utils.get_raw_web_content()` caches the content.
+        """
+
+        # given
+        requests_mock.get(self.URL, content=b"content", headers={"ETag": '"abc"'})
+
+        # when
+        first_result: bytes = get_raw_web_content(self.URL)
+        second_result: bytes = get_raw_web_content(self.URL)
+
+        # then
+        assert first_result == b"content"
+        assert second_result == b"content"
+        assert requests_mock.call_count == 1
+
+    def test_get_raw_web_content_not_modified(
+        self, cache: Cache, requests_mock: RequestsMocker
+    ) -> None:
+        """
+        Tests that `core.utilities.web_utils.get_raw_web_content()` revalidates stale
+        content with a conditional request and keeps it if it was not modified.
+        """
+
+        # given
+        cache_file_path: Path = WEB_CACHE_FOLDER / (
+            blake2b_hash(self.URL.encode("utf8")) + ".cache"
+        )
+        Cache.save_to_cache(
+            cache_file_path,
+            CachedWebContent(
+                content=b"cached content",
+                etag='"abc"',
+                last_modified="Wed, 01 Jan 2025 00:00:00 GMT",
+                timestamp=0,
+            ),
+        )
+        requests_mock.get(self.URL, status_code=304)
+
+        # when
+        first_result: bytes = get_raw_web_content(self.URL)
+        second_result: bytes = get_raw_web_content(self.URL)
+
+        # then
+        assert first_result == b"cached content"
+        assert second_result == b"cached content"
+        assert requests_mock.call_count == 1
+        assert requests_mock.last_request is not None
+        assert requests_mock.last_request.headers["If-None-Match"] == '"abc"'
+        assert (
+            requests_mock.last_request.headers["If-Modified-Since"]
+            == "Wed, 01 Jan 2025 00:00:00 GMT"
+        )
+
+    def test_user_agent(self, requests_mock: RequestsMocker) -> None:
+        """
+        Tests that the requests identify the application with its current name and
+        version after `core.utilities.web_utils.update_user_agent()` was called.
+        """
+
+        # given
+        app_name: str = QCoreApplication.applicationName()
+        app_version: str = QCoreApplication.applicationVersion()
+        requests_mock.get(self.URL, content=b"content")
+        QCoreApplication.setApplicationName("TestApp")
+        QCoreApplication.setApplicationVersion("1.0.0")
+        update_user_agent()
+
+        # when
+        get_raw_web_content_uncached(self.URL)
+
+        # then
+        assert requests_mock.last_request is not None
+        assert requests_mock.last_request.headers["User-Agent"].startswith(
+            "TestApp/1.0.0 ("
+        )
+
+        # when
+        QCoreApplication.setApplicationVersion("2.0.0")
+        update_user_agent()
+        get_raw_web_content_uncached(self.URL)
+
+        # then
+        assert requests_mock.last_request is not None
+        assert requests_mock.last_request.headers["User-Agent"].startswith(
+            "TestApp/2.0.0 ("
+        )
+
+        # cleanup
+        QCoreApplication.setApplicationName(app_name)
+        QCoreApplication.setApplicationVersion(app_version)
+        update_user_agent()
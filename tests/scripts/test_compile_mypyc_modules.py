@@ -0,0 +1,69 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import os
+from pathlib import Path
+
+from cutleast_core_lib.scripts.compile_mypyc_modules import find_marked_modules
+
+
+class TestCompileMypycModules:
+    """
+    Tests `scripts.compile_mypyc_modules`.
+    """
+
+    def test_find_marked_modules(self, tmp_path: Path) -> None:
+        """
+        Tests `scripts.compile_mypyc_modules.find_marked_modules()`.
+        """
+
+        # given
+        marked_module: Path = tmp_path / "marked.py"
+        marked_module.write_text('"""\nCopyright (c) Cutleast\n"""\n# mypyc\n')
+        nested_module: Path = tmp_path / "package" / "nested.py"
+        nested_module.parent.mkdir()
+        nested_module.write_bytes(b"# mypyc\r\nimport os\r\n")
+        late_marker_module: Path = tmp_path / "late.py"
+        late_marker_module.write_text("\n" * 20 + "# mypyc\n")
+        binary_module: Path = tmp_path / "binary.py"
+        binary_module.write_bytes(b"\xff\xfe\x00# mypyc\n")
+        (tmp_path / "unmarked.py").write_text("import os\n")
+        (tmp_path / "marked.txt").write_text("# mypyc\n")
+
+        # when
+        result: list[Path] = list(find_marked_modules(tmp_path))
+
+        # then
+        assert sorted(result) == sorted([marked_module, nested_module])
+
+    def test_find_marked_modules_with_scan_cache(self, tmp_path: Path) -> None:
+        """
+        Tests that `scripts.compile_mypyc_modules.find_marked_modules()` only scans
+        modules again that were modified since the last scan.
+        """
+
+        # given
+        source_folder: Path = tmp_path / "src"
+        source_folder.mkdir()
+        scan_cache_file: Path = tmp_path / "build" / "scan_cache.json"
+        unchanged_module: Path = source_folder / "unchanged.py"
+        unchanged_module.write_text("# mypyc\n")
+        modified_module: Path = source_folder / "modified.py"
+        modified_module.write_text("# mypyc\n")
+        list(find_marked_modules(source_folder, scan_cache_file))
+
+        # Remove the marker from both modules but keep the modification time of one
+        unchanged_mtime: int = unchanged_module.stat().st_mtime_ns
+        unchanged_module.write_text("import os\n")
+        os.utime(unchanged_module, ns=(unchanged_mtime, unchanged_mtime))
+        modified_module.write_text("import os\n")
+        modified_mtime: int = modified_module.stat().st_mtime_ns + 1_000_000_000
+        os.utime(modified_module, ns=(modified_mtime, modified_mtime))
+
+        # when
+        result: list[Path] = list(find_marked_modules(source_folder, scan_cache_file))
+
+        # then
+        assert result == [unchanged_module]
+        assert scan_cache_file.is_file()
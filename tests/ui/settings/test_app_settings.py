@@ -0,0 +1,157 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from pathlib import Path
+from threading import Event
+
+import pytest
+from PySide6.QtWidgets import QCheckBox, QPushButton, QSpinBox
+from pytestqt.qtbot import QtBot
+
+from cutleast_core_lib.core.cache.cache import Cache
+from cutleast_core_lib.core.config.app_config import AppConfig
+from cutleast_core_lib.core.filesystem.scanner import DirectoryScanner
+from cutleast_core_lib.test.base_test import BaseTest
+from cutleast_core_lib.test.utils import Utils
+from cutleast_core_lib.ui.settings.app_settings import AppSettings
+from cutleast_core_lib.ui.widgets.color_edit import ColorLineEdit
+
+
+class TestAppSettings(BaseTest):
+    """
+    Tests `ui.settings.app_settings.AppSettings`.
+    """
+
+    LOGS_NUM_BOX: tuple[str, type[QSpinBox]] = ("logs_num_box", QSpinBox)
+    """Identifier for accessing the private logs_num_box field."""
+
+    LOG_VISIBLE: tuple[str, type[QCheckBox]] = ("log_visible", QCheckBox)
+    """Identifier for accessing the private log_visible field."""
+
+    ACCENT_COLOR_ENTRY: tuple[str, type[ColorLineEdit]] = (
+        "accent_color_entry",
+        ColorLineEdit,
+    )
+    """Identifier for accessing the private accent_color_entry field."""
+
+    CLEAR_CACHE_BUTTON: tuple[str, type[QPushButton]] = (
+        "clear_cache_button",
+        QPushButton,
+    )
+    """Identifier for accessing the private clear_cache_button field."""
+
+    CACHE_SIZE_THREADS: tuple[str, type[set]] = ("cache_size_threads", set)
+    """Identifier for accessing the private cache_size_threads field."""
+
+    def test_changes_emit_signals(self, qtbot: QtBot, app_config: AppConfig) -> None:
+        """
+        Tests that changing a setting emits `changed_signal` and
+        `restart_required_signal`.
+        """
+
+        # given
+        widget = AppSettings(app_config)
+        qtbot.addWidget(widget)
+        logs_num_box: QSpinBox = Utils.get_private_field(
+            widget, *TestAppSettings.LOGS_NUM_BOX
+        )
+        log_visible: QCheckBox = Utils.get_private_field(
+            widget, *TestAppSettings.LOG_VISIBLE
+        )
+
+        # when/then
+        with qtbot.waitSignals(
+            [widget.changed_signal, widget.restart_required_signal], timeout=1000
+        ):
+            logs_num_box.setValue(logs_num_box.value() + 1)
+
+        with qtbot.waitSignals(
+            [widget.changed_signal, widget.restart_required_signal], timeout=1000
+        ):
+            log_visible.setChecked(not log_visible.isChecked())
+
+    def test_accent_color_changes_are_debounced(
+        self, qtbot: QtBot, app_config: AppConfig
+    ) -> None:
+        """
+        Tests that typing an accent color only emits `changed_signal` once.
+        """
+
+        # given
+        widget = AppSettings(app_config)
+        qtbot.addWidget(widget)
+        accent_color_entry: ColorLineEdit = Utils.get_private_field(
+            widget, *TestAppSettings.ACCENT_COLOR_ENTRY
+        )
+        emitted: list[None] = []
+        widget.changed_signal.connect(lambda: emitted.append(None))
+
+        # when
+        with qtbot.waitSignal(widget.restart_required_signal, timeout=1000):
+            for text in ["#", "#f", "#ff", "#fff"]:
+                accent_color_entry.setText(text)
+
+        # then
+        assert len(emitted) == 1
+
+    def test_cache_size(
+        self, qtbot: QtBot, app_config: AppConfig, cache: Cache
+    ) -> None:
+        """
+        Tests that the cache size is displayed on the clear cache button after it was
+        computed in the background.
+        """
+
+        # given
+        Cache.save_to_cache(Path("test.cache"), b"\x00" * 2048)
+        widget = AppSettings(app_config)
+        qtbot.addWidget(widget)
+        clear_cache_button: QPushButton = Utils.get_private_field(
+            widget, *TestAppSettings.CLEAR_CACHE_BUTTON
+        )
+
+        # when
+        qtbot.waitUntil(lambda: "…" not in clear_cache_button.text(), timeout=1000)
+
+        # then
+        assert clear_cache_button.isEnabled()
+        assert clear_cache_button.text().startswith("Clear Cache (")
+        assert clear_cache_button.text().endswith("KB)")
+
+    def test_cache_size_thread_released_after_page_deleted(
+        self,
+        qtbot: QtBot,
+        app_config: AppConfig,
+        cache: Cache,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Tests that the thread computing the cache size is released when it finished,
+        even if its page was deleted before.
+        """
+
+        # given
+        Cache.save_to_cache(Path("test.cache"), b"\x00" * 2048)
+        page_deleted = Event()
+
+        def get_folder_size(folder: Path) -> int:
+            page_deleted.wait(timeout=1)
+            return 2048
+
+        monkeypatch.setattr(DirectoryScanner, "get_folder_size", get_folder_size)
+        # Ensure that the size is not reused from another test
+        monkeypatch.setattr(AppSettings, "_AppSettings__cache_sizes", {})
+        widget = AppSettings(app_config)
+        cache_size_threads: set = Utils.get_private_field(
+            widget, *TestAppSettings.CACHE_SIZE_THREADS
+        )
+        assert cache_size_threads
+
+        # when
+        with qtbot.waitSignal(widget.destroyed, timeout=1000):
+            widget.deleteLater()
+        page_deleted.set()
+
+        # then
+        qtbot.waitUntil(lambda: not cache_size_threads, timeout=1000)